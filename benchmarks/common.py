@@ -0,0 +1,128 @@
+"""Helpers shared by the benchmark scripts"""
+import glob
+import hashlib
+import http.server
+import os
+import sys
+import threading
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from ufcpy.utils import athlete_url
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SITE = "https://ufc.com"
+
+
+def load_page(source: str) -> bytes:
+    """A saved athlete page, or the live page of a fighter name downloaded once"""
+    if os.path.isfile(source):
+        with open(source, "rb") as fh:
+            return fh.read()
+    return requests.get(athlete_url(source)).content
+
+
+def fixture_slugs() -> list:
+    """The slug of every checked-in athlete page"""
+    return sorted(os.path.basename(path)[:-len(".html")] for path in glob.glob(os.path.join(FIXTURES, "athlete", "*.html")))
+
+
+def fixture_page(slug: str) -> bytes:
+    """A checked-in athlete page"""
+    with open(os.path.join(FIXTURES, "athlete", f"{slug}.html"), "rb") as fh:
+        return fh.read()
+
+
+class _FixtureHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/")
+        number = (parse_qs(url.query).get("page") or ["0"])[0]
+        if path == "/athletes":
+            return self._send(200, os.path.join(FIXTURES, "athletes.html"))
+        if path == "/athletes/all":
+            # Pages past the last one render an empty listing, like on ufc.com
+            page = os.path.join(FIXTURES, "athletes-all", f"page-{number}.html")
+            return self._send(200, page if os.path.isfile(page) else os.path.join(FIXTURES, "athletes-all", "empty.html"))
+        if path.startswith("/athlete/") and number != "0":
+            # Later pages of an athlete's record, an empty listing past the last one
+            page = os.path.join(FIXTURES, "history", path[len("/athlete/"):], f"page-{number}.html")
+            return self._send(200, page if os.path.isfile(page) else os.path.join(FIXTURES, "history", "empty.html"))
+        for kind in ("athlete", "event"):
+            if path.startswith(f"/{kind}/"):
+                page = os.path.join(FIXTURES, kind, f"{path[len(kind) + 2:]}.html")
+                if os.path.isfile(page):
+                    return self._send(200, page)
+        # Like ufc.com, unknown athletes redirect to a page that isn't one
+        if path == "/missing":
+            return self._send(200, None)
+        self.send_response(302)
+        self.send_header("Location", "/missing")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status: int, path):
+        body = b"<html></html>"
+        if path is not None:
+            with open(path, "rb") as fh:
+                body = fh.read()
+        # Like ufc.com, pages carry an ETag and conditional GETs for an unchanged one get a 304
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FixtureServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Streamed lookups hang up as soon as they have every field, that isn't an error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class FixtureSite:
+    """A local stand-in for ufc.com serving the checked-in fixtures over HTTP"""
+
+    def __init__(self):
+        self.server = _FixtureServer(("127.0.0.1", 0), _FixtureHandler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "FixtureSite":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def session(self) -> requests.Session:
+        """A session sending every ufc.com request to this site instead, for ``Transport(session=...)``"""
+        return _SiteSession(self.url)
+
+
+class _SiteSession(requests.Session):
+    def __init__(self, base: str):
+        super().__init__()
+        self.base = base
+
+    def request(self, method, url, *args, **kwargs):
+        for prefix in (SITE, SITE.replace("://", "://www.")):
+            if url.startswith(prefix):
+                url = self.base + url[len(prefix):]
+        return super().request(method, url, *args, **kwargs)
@@ -0,0 +1,54 @@
+"""
+Retained memory per Fighter, with and without ``compact``
+
+Usage::
+
+    python benchmarks/memory.py "Jon Jones" "Holly Holm"
+    python benchmarks/memory.py --count 200 saved/jon-jones.html
+
+Each argument is either a saved athlete page or a fighter name to download once.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from common import load_page
+
+from bs4 import BeautifulSoup
+
+from ufcpy.Fighter import Fighter
+
+
+def retained_per_fighter(pages: list, count: int, compact: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    fighters = []
+    for i in range(count):
+        fighter = Fighter(BeautifulSoup(pages[i % len(pages)], "lxml"), compact=compact)
+        fighter.stats
+        fighters.append(fighter)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pages", nargs="+", help="saved athlete pages or fighter names")
+    parser.add_argument("--count", type=int, default=50, help="fighters to keep alive per mode")
+    args = parser.parse_args()
+
+    pages = [load_page(source) for source in args.pages]
+    full = retained_per_fighter(pages, args.count, compact=False)
+    compact = retained_per_fighter(pages, args.count, compact=True)
+
+    print(f"fighters per mode: {args.count}")
+    print(f"default: {full / 1024:10.1f} KiB retained per fighter")
+    print(f"compact: {compact / 1024:10.1f} KiB retained per fighter")
+    print(f"saving:  {full / compact:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
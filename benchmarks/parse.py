@@ -0,0 +1,86 @@
+"""
+Per-page parse and extraction time and peak RSS of the bs4 and lxml backends, full and partial
+
+Usage::
+
+    python benchmarks/parse.py "Jon Jones" "Holly Holm"
+    python benchmarks/parse.py --rounds 200 saved/jon-jones.html
+
+Each backend and mode runs in its own process so their peak RSS can be compared.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from common import load_page
+
+from ufcpy.core import BACKENDS, parse_content
+from ufcpy.stats import extract_stats
+
+
+def measure(pages: list, backend: str, partial: bool, rounds: int) -> dict:
+    parse_time = 0.0
+    extract_time = 0.0
+    trees = []
+    for i in range(rounds):
+        content = pages[i % len(pages)]
+        start = time.perf_counter()
+        tree = parse_content(content, backend=backend, partial=partial)
+        parse_time += time.perf_counter() - start
+        start = time.perf_counter()
+        extract_stats(tree)
+        extract_time += time.perf_counter() - start
+        # Keep a page per input alive so the peak reflects retained trees too
+        if len(trees) < len(pages):
+            trees.append(tree)
+    return {
+        "backend": backend,
+        "partial": partial,
+        "pages": rounds,
+        "parse_ms": parse_time / rounds * 1000,
+        "extract_ms": extract_time / rounds * 1000,
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pages", nargs="+", help="saved athlete pages or fighter names")
+    parser.add_argument("--rounds", type=int, default=100, help="pages parsed per backend")
+    parser.add_argument("--backend", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--partial", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help="print machine readable results")
+    args = parser.parse_args()
+
+    if args.backend:
+        pages = [load_page(source) for source in args.pages]
+        print(json.dumps(measure(pages, args.backend, args.partial, args.rounds)))
+        return
+
+    results = []
+    for backend in BACKENDS:
+        for mode in ([], ["--partial"]):
+            out = subprocess.run(
+                [sys.executable, __file__, *args.pages, "--rounds", str(args.rounds), "--backend", backend, *mode],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(out))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'backend':8} {'mode':8} {'parse ms':>10} {'extract ms':>11} {'peak RSS KiB':>13}")
+    for result in results:
+        print(
+            f"{result['backend']:8} {'partial' if result['partial'] else 'full':8} {result['parse_ms']:10.2f} "
+            f"{result['extract_ms']:11.2f} {result['peak_rss_kib']:13d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
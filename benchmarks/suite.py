@@ -0,0 +1,275 @@
+"""
+Offline benchmark suite over the checked-in athlete, fight history, titleholder, directory and event pages
+
+Usage::
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --rounds 50 --json results.json
+    python benchmarks/suite.py --compare baseline.json --threshold 1.15
+
+Pages are parsed straight from ``benchmarks/fixtures`` or fetched from a local stand-in for
+ufc.com serving them, so no run touches the network. ``--compare`` exits with status 1 when a
+case's median got slower than the baseline's by more than ``--threshold``.
+"""
+import argparse
+import json
+import platform
+import statistics
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import FIXTURES, FixtureSite, fixture_page, fixture_slugs
+
+import ufcpy
+from ufcpy.Champion import Champion
+from ufcpy.Event import Event
+from ufcpy.Fighter import Fighter, find_fighters_by_fullname
+from ufcpy.cache import DiskCache, get_fighter_cache, set_fighter_cache
+from ufcpy.core import parse, parse_content
+from ufcpy.roster import hydrate, iter_athletes, iter_pages
+from ufcpy.sync import RosterSync
+from ufcpy.transport import Transport
+from ufcpy.history import iter_history
+from ufcpy.utils import athlete_url
+
+PROPERTIES = [name for name, value in vars(Fighter).items() if isinstance(value, property)]
+MODES = [("bs4", False), ("bs4", True), ("lxml", False), ("lxml", True)]
+
+# Fields each fixture is missing on purpose, checked before anything is timed
+MISSING = {
+    "holly-holm": ("reach", "leg_reach", "landed_takedowns", "attempted_takedowns"),
+    "kayla-harrison": ("leg_reach",),
+    "conor-mcgregor": ("takedown_accuracy", "landed_takedowns", "attempted_takedowns"),
+}
+
+
+def _mode(backend: str, partial: bool) -> str:
+    return f"{backend}-partial" if partial else backend
+
+
+def _read_all(fighter: Fighter) -> None:
+    for name in PROPERTIES:
+        try:
+            getattr(fighter, name)
+        except (AttributeError, IndexError, TypeError, ValueError):
+            pass
+
+
+def check_fixtures(pages: dict) -> None:
+    for slug, page in pages.items():
+        stats = Fighter(parse_content(page)).stats
+        for backend, partial in MODES:
+            other = Fighter(parse_content(page, backend=backend, partial=partial)).stats
+            if other != stats:
+                raise SystemExit(f"{slug}: {_mode(backend, partial)} extraction differs from bs4")
+        for field in MISSING.get(slug, ()):
+            if getattr(stats, field) is not None:
+                raise SystemExit(f"{slug}: expected {field} to be missing")
+
+
+def check_history(pages: dict, site: FixtureSite) -> None:
+    transport = Transport(session=site.session())
+    for slug, page in pages.items():
+        # The first page is the athlete page itself, later ones are checked in under history/
+        expected = page.count(b"c-card-event--athlete-results__headline")
+        directory = os.path.join(FIXTURES, "history", slug)
+        for name in os.listdir(directory) if os.path.isdir(directory) else ():
+            with open(os.path.join(directory, name), "rb") as fh:
+                expected += fh.read().count(b"c-card-event--athlete-results__headline")
+        bouts = list(iter_history(slug, transport=transport))
+        if len(bouts) != expected:
+            raise SystemExit(f"{slug}: expected {expected} bouts in the history, got {len(bouts)}")
+        for bout in bouts:
+            if None in (bout.opponent_slug, bout.event_slug, bout.date, bout.result, bout.method, bout.round, bout.time):
+                raise SystemExit(f"{slug}: incomplete bout {bout.as_dict()}")
+
+
+def check_roster(pages: dict, site: FixtureSite) -> None:
+    transport = Transport(session=site.session())
+    walked = list(iter_pages(transport=transport))
+    if len(walked) < 2 or walked[-1].has_next:
+        raise SystemExit(f"roster: expected a walk over several pages ending on the last, got {walked}")
+    cards = [card for page in walked for card in page.cards]
+    if sorted(card.slug for card in cards) != sorted(pages):
+        raise SystemExit("roster: the directory doesn't list every fixture")
+    for card in cards:
+        fighter = Fighter(parse_content(pages[card.slug]))
+        if (card.name, card.record, card.weight_class) != (fighter.name, fighter.record, fighter.weight_class):
+            raise SystemExit(f"{card.slug}: directory card differs from the athlete page")
+
+
+def cases(pages: dict, site: FixtureSite):
+    """Every benchmark as ``(name, items per round, callable)``"""
+    slugs = list(pages)
+    names = [Fighter(parse_content(pages[slug], backend="lxml")).name for slug in slugs]
+    transport = Transport(session=site.session())
+
+    for backend, partial in MODES:
+        def parse_pages(backend=backend, partial=partial):
+            for page in pages.values():
+                parse_content(page, backend=backend, partial=partial)
+        yield f"parse_content[{_mode(backend, partial)}]", len(pages), parse_pages
+
+    for backend, partial in MODES:
+        def parse_urls(backend=backend, partial=partial):
+            for slug in slugs:
+                parse(athlete_url(slug), transport=transport, backend=backend, partial=partial)
+        yield f"core.parse[{_mode(backend, partial)}]", len(slugs), parse_urls
+
+    trees = {backend: [parse_content(page, backend=backend) for page in pages.values()] for backend in ("bs4", "lxml")}
+    for backend, parsed in trees.items():
+        def extract(parsed=parsed):
+            for tree in parsed:
+                _read_all(Fighter(tree))
+        yield f"fighter_properties[{backend}]", len(parsed), extract
+
+    def champion_divisions():
+        champion = Champion(transport=transport)
+        champion.as_dict()
+    yield "champion_divisions", 12, champion_divisions
+
+    def champion_profiles():
+        champion = Champion(transport=transport)
+        for fighter in champion.all_objects():
+            fighter.record
+    yield "champion_profiles", 12, champion_profiles
+
+    def event_card():
+        event = Event("ufc-300", transport=transport)
+        event.wait()
+    yield "event_card", 14, event_card
+
+    def fight_history():
+        for slug in slugs:
+            for bout in iter_history(slug, transport=transport):
+                bout.result
+    yield "fight_history", len(slugs), fight_history
+
+    def roster_walk():
+        for card in iter_athletes(transport=transport):
+            card.record
+    yield "roster_walk", len(slugs), roster_walk
+
+    def roster_hydrate():
+        for result in hydrate(iter_athletes(transport=transport), transport=transport):
+            result.fighter.stats
+    yield "roster_hydrate", len(slugs), roster_hydrate
+
+    # After the first run only the directory is walked, nothing changed
+    directory = tempfile.mkdtemp()
+    sync = RosterSync(os.path.join(directory, "roster.json"), transport=transport)
+    yield "roster_sync", len(slugs), sync.run
+
+    # Every profile is checked with a conditional GET, which the site answers with a 304
+    cached = Transport(session=site.session(), cache=DiskCache(os.path.join(directory, "cache.sqlite"), ttl=0))
+    revalidating = RosterSync(os.path.join(directory, "revalidate.json"), transport=cached)
+    yield "roster_sync[revalidate]", len(slugs), lambda: revalidating.run(revalidate=True)
+
+    lookups = names + ["Not A Fighter"]
+    for backend, partial in (("bs4", False), ("lxml", True)):
+        def bulk(backend=backend, partial=partial):
+            for result in find_fighters_by_fullname(lookups, max_workers=8, transport=transport, backend=backend, partial=partial):
+                if result.ok:
+                    result.fighter.stats
+        yield f"bulk_lookup[{_mode(backend, partial)}]", len(lookups), bulk
+
+
+def measure(func, rounds: int, items: int) -> dict:
+    func()
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "rounds": rounds,
+        "items": items,
+        "median_ms": statistics.median(times),
+        "mean_ms": statistics.mean(times),
+        "min_ms": min(times),
+        "max_ms": max(times),
+        "stdev_ms": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "per_item_ms": statistics.median(times) / items,
+    }
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=FIXTURES, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """The cases whose median got slower than the baseline's by more than ``threshold``, printing every ratio"""
+    regressions = []
+    print(f"\n{'case':34} {'baseline ms':>12} {'now ms':>10} {'ratio':>7}")
+    for name, result in results["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        flag = "  slower" if ratio > threshold else ""
+        print(f"{name:34} {old['median_ms']:12.2f} {result['median_ms']:10.2f} {ratio:7.2f}{flag}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="timed rounds per case")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON, - for stdout")
+    parser.add_argument("--compare", metavar="PATH", help="a previous --json run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.10, help="median ratio counted as a regression")
+    args = parser.parse_args()
+
+    pages = {slug: fixture_page(slug) for slug in fixture_slugs()}
+    check_fixtures(pages)
+
+    results = {
+        "meta": {
+            "ufcpy": ufcpy.__version__,
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "fixtures": len(pages),
+        },
+        "results": {},
+    }
+    cache = get_fighter_cache()
+    # Every round should do the work, not hit the fighter cache
+    set_fighter_cache(None)
+    try:
+        with FixtureSite() as site:
+            check_roster(pages, site)
+            check_history(pages, site)
+            for name, items, func in cases(pages, site):
+                if args.filter in name:
+                    results["results"][name] = measure(func, args.rounds, items)
+                    if args.json != "-":
+                        result = results["results"][name]
+                        print(f"{name:34} {result['median_ms']:10.2f} ms  {result['per_item_ms']:8.3f} ms/item")
+    finally:
+        set_fighter_cache(cache)
+
+    if args.json == "-":
+        print(json.dumps(results, indent=2))
+    elif args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            if compare(results, json.load(fh), args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,12 @@ setup(
         'requests >= 2.32.3', 
         'lxml >= 5.3.0'
     ],
+    extras_require={
+        'aio': ['aiohttp >= 3.9'],
+        'brotli': ['brotli'],
+        'numpy': ['numpy >= 1.22'],
+        'arrow': ['pyarrow >= 14'],
+    },
     license='MIT',
     keywords=['ufc', 'mma', 'mixed martial arts', 'fighting', 'fighters', 'ufc-api', 'mma-api'],
     classifiers=[
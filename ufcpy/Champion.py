@@ -1,125 +1,168 @@
-import urllib3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
 from bs4 import BeautifulSoup as bs
 
-from .Fighter import Fighter
+from .Fighter import Fighter, LazyFighter
+from .cache import get_fighter_cache
+from .core import fetch
+from .listing import AthleteCard, parse_cards, parse_listing
+from .transport import Transport
+
+TITLEHOLDERS_CLASS = "block-views-blockathletes-titleholders-block-1"
+
+
+def parse_titleholders(content: bytes) -> bs:
+    """:class:`BeautifulSoup`: Parses only the titleholders block of the athletes page"""
+    return parse_listing(content, TITLEHOLDERS_CLASS)
+
+
+# Champion attributes mapped to the (gender, weight class) of their division
+DIVISIONS = {
+    "womens_strawweight": ("Woman", "Strawweight"),
+    "womens_flyweight": ("Woman", "Flyweight"),
+    "womens_bantamweight": ("Woman", "Bantamweight"),
+    "womens_featherweight": ("Woman", "Featherweight"),
+    "flyweight": ("Man", "Flyweight"),
+    "bantamweight": ("Man", "Bantamweight"),
+    "featherweight": ("Man", "Featherweight"),
+    "lightweight": ("Man", "Lightweight"),
+    "welterweight": ("Man", "Welterweight"),
+    "middleweight": ("Man", "Middleweight"),
+    "lightheavyweight": ("Man", "Light Heavyweight"),
+    "heavyweight": ("Man", "Heavyweight"),
+}
 
 
 class Champion:
     BASE_URL = "https://ufc.com/athletes"
 
-    def __init__(self):
+    def __init__(self, _parsed_url: bs = None, transport: Transport = None, max_workers: int = 8):
         """
         Reprents all of the current champions
+
+        Only the titleholders block of the athletes page is parsed. Names, divisions, records
+        and images come from the listing cards, a champion's full profile is only fetched
+        once a field outside their card is read
         """
-        req = urllib3.PoolManager()
-        res = req.request("GET", self.BASE_URL)
-        self._parsed_url = bs(res.data, "html.parser")
-        self._div = self._parsed_url.find(
-            class_="views-element-container block block-views block-views-blockathletes-titleholders-block-1"
-        )
-        self._athlete_blocks = self._div.find_all(
-            class_="node node--type-athlete node--view-mode-listing-detail clearfix athlete-listing-detail-wrp"
-        )
+        self._transport = transport
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._load(_parsed_url)
+
+    def _load(self, _parsed_url: bs = None):
+        if _parsed_url is None:
+            _parsed_url = parse_titleholders(fetch(self.BASE_URL, transport=self._transport))
+        self._div = _parsed_url.find(class_=TITLEHOLDERS_CLASS)
+        self._cards = parse_cards(self._div) if self._div is not None else []
+        self._fighters = [LazyFighter(card, transport=self._transport) for card in self._cards]
+        self._index = None
+
+    def refresh(self):
+        """Downloads the titleholders again and drops every loaded champion profile"""
+        cache = get_fighter_cache()
+        with self._lock:
+            if cache is not None:
+                for card in self._cards:
+                    cache.invalidate(card.slug)
+            self._load()
+
+    def all_cards(self) -> List[AthleteCard]:
+        """:class:`List[AthleteCard]`: The listing cards of all of the current champions"""
+        return list(self._cards)
 
     def all_names(self) -> list:
         """:class:`List[str]`: All of the current champions names"""
-        athletes = []
-        for athlete in self._athlete_blocks:
-            name = athlete.find_all(
-                class_="field field--name-title field--type-string field--label-hidden"
-            )
-            name_string = "".join(str(e) for e in name)
-            name = name_string.split(">")[1].split("<")[0]
-            athletes.append(name)
-        return athletes
+        return [card.name for card in self._cards]
+
+    def _build(self):
+        with self._lock:
+            if self._index is not None:
+                return
+            index = {}
+            for fighter in self._fighters:
+                # Only champions whose card lacks a division need their profile for this
+                index.setdefault((fighter.gender, fighter.weight_class), fighter)
+            self._index = index
+
+    @property
+    def index(self) -> Dict[Tuple[str, str], Fighter]:
+        """:class:`Dict[Tuple[str, str], Fighter]`: The current champions keyed by ``(gender, weight class)``"""
+        self._build()
+        return self._index
 
     def all_objects(self) -> list:
-        """:class:`List[Fighter]`: All of the current champions in `Fighter` objects"""
-        athletes = []
-        for athlete in self.all_names():
-            athletes.append(Fighter(athlete))
-        return athletes
+        """:class:`List[Fighter]`: All of the current champions in `Fighter` objects, with their profiles fetched concurrently"""
+        fighters = list(self._fighters)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            list(executor.map(LazyFighter.load, fighters))
+        return fighters
+
+    def get(self, weight_class: str, gender: str = "Man") -> Optional[Fighter]:
+        """Optional[:class:`Fighter`]: The current champion of a weight class, e.g. ``get("Strawweight", "Woman")``"""
+        return self.index.get((gender, weight_class))
+
+    def as_dict(self) -> Dict[str, Optional[Fighter]]:
+        """:class:`Dict[str, Optional[Fighter]]`: Every division's current champion keyed by attribute name"""
+        return {name: self.get(weight_class, gender) for name, (gender, weight_class) in DIVISIONS.items()}
 
     @property
     def womens_strawweight(self) -> Fighter:
         """:class:`Fighter`: The current Women's Strawweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Strawweight" and athlete.gender == "Woman":
-                return athlete or None
+        return self.get("Strawweight", "Woman")
 
     @property
     def womens_flyweight(self) -> Fighter:
         """:class:`Fighter`: The current Women's Flyweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Flyweight" and athlete.gender == "Woman":
-                return athlete or None
+        return self.get("Flyweight", "Woman")
 
     @property
     def womens_bantamweight(self) -> Fighter:
         """:class:`Fighter`: The current Women's Bantamweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Bantamweight" and athlete.gender == "Woman":
-                return athlete or None
+        return self.get("Bantamweight", "Woman")
 
     @property
     def womens_featherweight(self) -> Fighter:
         """:class:`Fighter`: The current Women's Featherweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Featherweight" and athlete.gender == "Woman":
-                return athlete or None
+        return self.get("Featherweight", "Woman")
 
     @property
     def flyweight(self) -> Fighter:
         """:class:`Fighter`: The current Flyweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Flyweight" and athlete.gender == "Man":
-                return athlete or None
+        return self.get("Flyweight")
 
     @property
     def bantamweight(self) -> Fighter:
         """:class:`Fighter`: The current Bantamweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Bantamweight" and athlete.gender == "Man":
-                return athlete or None
+        return self.get("Bantamweight")
 
     @property
     def featherweight(self) -> Fighter:
         """:class:`Fighter`: The current Featherweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Featherweight" and athlete.gender == "Man":
-                return athlete or None
+        return self.get("Featherweight")
 
     @property
     def lightweight(self) -> Fighter:
         """:class:`Fighter`: The current Lightweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Lightweight":
-                return athlete or None
+        return self.get("Lightweight")
 
     @property
     def welterweight(self) -> Fighter:
         """:class:`Fighter`: The current Welterweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Welterweight":
-                return athlete or None
-    
+        return self.get("Welterweight")
+
     @property
     def middleweight(self) -> Fighter:
         """:class:`Fighter`: The current Middleweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Middleweight":
-                return athlete or None
+        return self.get("Middleweight")
 
     @property
     def lightheavyweight(self) -> Fighter:
         """:class:`Fighter`: The current Light Heavyweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Light Heavyweight":
-                return athlete or None
-    
+        return self.get("Light Heavyweight")
+
     @property
     def heavyweight(self) -> Fighter:
         """:class:`Fighter`: The current Heavyweight champion"""
-        for athlete in self.all_objects():
-            if athlete.get_weight_class() == "Heavyweight":
-                return athlete or None
\ No newline at end of file
+        return self.get("Heavyweight")
@@ -0,0 +1,227 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional
+
+from bs4 import BeautifulSoup as bs
+
+from .Fighter import LazyFighter, LookupResult
+from .cache import get_fighter_cache
+from .core import fetch
+from .exceptions import UFCPyError
+from .listing import AthleteCard, class_text, link_slug, parse_listing, read_result
+from .transport import Transport
+from .utils import athlete_slug
+
+EVENT_URL = "https://ufc.com/event"
+FIGHT_CLASS = "c-listing-fight"
+HEADLINE_CLASSES = ("c-hero__headline-prefix", "c-hero__headline", "c-hero__headline-suffix")
+
+# Containers of the card's segments, in running order from the main card down
+SEGMENTS = {
+    "main-card": "Main Card",
+    "fight-card-prelims": "Prelims",
+    "fight-card-prelims-early": "Early Prelims",
+}
+
+
+def event_url(slug: str) -> str:
+    """:class:`str`: The event page URL for an event slug like ``ufc-300``"""
+    return f"{EVENT_URL}/{slug}"
+
+
+def parse_event(content: bytes) -> bs:
+    """:class:`BeautifulSoup`: Parses only the headline and the fight card of an event page"""
+    return parse_listing(content, *HEADLINE_CLASSES, *SEGMENTS, FIGHT_CLASS)
+
+
+def _corner(fight, color: str) -> Optional[AthleteCard]:
+    block = fight.find(class_=f"{FIGHT_CLASS}__corner-name--{color}")
+    if block is None:
+        return None
+    name = block.get_text(" ", strip=True)
+    if not name:
+        return None
+    return AthleteCard(name=name, slug=link_slug(block) or athlete_slug(name))
+
+
+def _winner(fight) -> Optional[str]:
+    # Finished bouts mark each corner with an outcome like "c-listing-fight__outcome--win"
+    for color in ("red", "blue"):
+        corner = fight.find(class_=f"{FIGHT_CLASS}__corner-body--{color}")
+        if corner is None:
+            continue
+        for outcome in corner.find_all(class_=lambda clas: clas and clas.startswith(f"{FIGHT_CLASS}__outcome--")):
+            if outcome.get_text(strip=True).lower() == "win":
+                return color
+    return None
+
+
+class EventBout:
+    """A single bout of an event's card, its fighters' profiles load in the background"""
+
+    __slots__ = ("red", "blue", "weight_class", "segment", "winner", "method", "round", "time")
+
+    def __init__(
+        self,
+        red: LazyFighter,
+        blue: LazyFighter,
+        weight_class: Optional[str] = None,
+        segment: Optional[str] = None,
+        winner: Optional[str] = None,
+        method: Optional[str] = None,
+        round: Optional[int] = None,
+        time: Optional[str] = None,
+    ):
+        self.red = red
+        self.blue = blue
+        self.weight_class = weight_class
+        self.segment = segment
+        self.winner = winner
+        self.method = method
+        self.round = round
+        self.time = time
+
+    def __repr__(self) -> str:
+        return f"<EventBout red={self.red.name!r} blue={self.blue.name!r} weight_class={self.weight_class!r}>"
+
+    @property
+    def fighters(self) -> List[LazyFighter]:
+        """:class:`List[LazyFighter]`: The red and blue corner"""
+        return [self.red, self.blue]
+
+
+class Event:
+    def __init__(
+        self,
+        slug: Optional[str] = None,
+        _parsed_url: bs = None,
+        transport: Transport = None,
+        max_workers: int = 8,
+        load_profiles: bool = True,
+    ):
+        """
+        Represents an event and its fight card, e.g. ``Event("ufc-300")``
+
+        Only the headline and the card of the event page are parsed, so bouts, names and slugs
+        are available right away. With ``load_profiles`` every fighter's profile starts loading
+        in the background at once, each fighter is fetched once however many bouts they are in
+        and profiles already in the fighter cache are reused without a request
+        """
+        if slug is None and _parsed_url is None:
+            raise UFCPyError("An event needs either a slug or a parsed event page")
+        self.slug = slug
+        self._transport = transport
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._futures = None
+        if _parsed_url is None:
+            _parsed_url = parse_event(fetch(event_url(slug), transport=transport))
+        self._load(_parsed_url)
+        if load_profiles:
+            self.load_profiles()
+
+    def __repr__(self) -> str:
+        return f"<Event name={self.name!r} bouts={len(self.bouts)}>"
+
+    def __str__(self) -> str:
+        return self.name or self.slug or ""
+
+    def _load(self, _parsed_url: bs):
+        parts = [class_text(_parsed_url, clas) for clas in HEADLINE_CLASSES[:2]]
+        self.name = ": ".join(part for part in parts if part) or None
+        self.date = None
+        suffix = _parsed_url.find(class_=HEADLINE_CLASSES[2])
+        if suffix is not None and (suffix.get("data-timestamp") or "").isdigit():
+            self.date = datetime.fromtimestamp(int(suffix["data-timestamp"]), tz=timezone.utc)
+
+        self._fighters: Dict[str, LazyFighter] = {}
+        self.bouts: List[EventBout] = []
+        for fight in _parsed_url.find_all(class_=FIGHT_CLASS):
+            red, blue = _corner(fight, "red"), _corner(fight, "blue")
+            if red is None or blue is None:
+                continue
+            segment = next(
+                (SEGMENTS[clas] for parent in fight.parents for clas in parent.get("class") or () if clas in SEGMENTS),
+                None,
+            )
+            bout = EventBout(
+                self._fighter(red),
+                self._fighter(blue),
+                weight_class=class_text(fight, f"{FIGHT_CLASS}__class-text"),
+                segment=segment,
+                winner=_winner(fight),
+            )
+            for result in fight.find_all(class_=f"{FIGHT_CLASS}__result"):
+                read_result(bout, class_text(result, f"{FIGHT_CLASS}__result-label"), class_text(result, f"{FIGHT_CLASS}__result-text"))
+            self.bouts.append(bout)
+
+    def _fighter(self, card: AthleteCard) -> LazyFighter:
+        fighter = self._fighters.get(card.slug)
+        if fighter is None:
+            fighter = self._fighters[card.slug] = LazyFighter(card, transport=self._transport, backend="lxml", partial=True)
+        return fighter
+
+    @property
+    def url(self) -> Optional[str]:
+        """Optional[:class:`str`]: The event page"""
+        return event_url(self.slug) if self.slug else None
+
+    @property
+    def fighters(self) -> List[LazyFighter]:
+        """:class:`List[LazyFighter]`: Every fighter on the card once, in card order"""
+        return list(self._fighters.values())
+
+    def get(self, fighter: str) -> Optional[LazyFighter]:
+        """Optional[:class:`LazyFighter`]: A fighter on the card by slug or full name"""
+        found = self._fighters.get(fighter)
+        if found is None:
+            found = self._fighters.get(athlete_slug(fighter))
+        return found
+
+    def load_profiles(self) -> None:
+        """Starts loading every fighter's profile in the background, does nothing when already started"""
+        with self._lock:
+            if self._futures is not None:
+                return
+            cache = get_fighter_cache()
+            futures = {}
+            executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            for index, fighter in enumerate(self._fighters.values()):
+                # Only a record actually handed back is used, an entry can expire between a check and a read
+                cached = cache.get(fighter.slug) if cache is not None else None
+                if cached is not None:
+                    # A cache hit costs no request, it isn't worth a thread
+                    future = Future()
+                    future.set_result(fighter.load(cached))
+                else:
+                    future = executor.submit(fighter.load)
+                futures[future] = index
+            # The queued loads still run, the threads just go away once they are done
+            executor.shutdown(wait=False)
+            self._futures = futures
+
+    @property
+    def loaded(self) -> int:
+        """:class:`int`: How many fighters' profiles have been loaded so far"""
+        return sum(fighter.loaded for fighter in self._fighters.values())
+
+    def iter_profiles(self) -> Iterator[LookupResult]:
+        """
+        Yields each fighter's profile as it arrives, starting the loads if they were not yet
+
+        A failed load is yielded as a :class:`LookupResult` carrying the error, reading a field
+        of that fighter afterwards tries the request again
+        """
+        self.load_profiles()
+        fighters = self.fighters
+        for future in as_completed(self._futures):
+            index = self._futures[future]
+            try:
+                yield LookupResult(fighters[index].name, index, fighter=future.result())
+            except Exception as error:
+                yield LookupResult(fighters[index].name, index, error=error)
+
+    def wait(self) -> List[LookupResult]:
+        """:class:`List[LookupResult]`: Waits for every profile, returning the results in card order"""
+        return sorted(self.iter_profiles(), key=lambda result: result.index)
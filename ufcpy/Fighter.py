@@ -1,79 +1,188 @@
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Iterable, Iterator, List, Optional, Tuple
 from bs4 import BeautifulSoup 
 
-from .core import parse, find_element
+from .cache import get_fighter_cache
+from .core import parse
+from .history import Bout, iter_history
+from .listing import AthleteCard
+from .names import resolve_slug
+from .stats import FighterStats, extract_stats
+from .transport import Transport
+from .utils import athlete_slug, athlete_url, split_division
 
-def find_fighter_by_fullname(fighter: str):
-    base_url = "https://ufc.com/athlete"
-    url = fighter.lower().replace(" ", "-")
-    parsed_url = parse(f"{base_url}/{url}")
-    return Fighter(parsed_url)
+def find_fighter_by_fullname(fighter: str, compact: bool = False, transport: Transport = None, use_cache: bool = True, backend: str = "bs4", partial: bool = False):
+    """
+    :class:`Fighter`: Looks a fighter up by their full name
+
+    With a :class:`NameIndex` set through :func:`set_name_index` the name is matched against the roster
+    locally, so accents, suffixes and typos resolve to the right page and unknown names fail without a request
+    """
+    return find_fighter_by_slug(resolve_slug(fighter), compact=compact, transport=transport, use_cache=use_cache, backend=backend, partial=partial)
+
+def find_fighter_by_slug(slug: str, compact: bool = False, transport: Transport = None, use_cache: bool = True, backend: str = "bs4", partial: bool = False):
+    """
+    :class:`Fighter`: Looks a fighter up by the slug of their athlete page, e.g. ``jon-jones``
+
+    ``backend="lxml"`` parses the page with :mod:`lxml.html` directly instead of BeautifulSoup.
+    ``partial=True`` only keeps the hero, bio and stat sections of the page and stops parsing once they are read
+    """
+    cache = get_fighter_cache() if use_cache else None
+    if cache is not None:
+        cached = cache.get(slug)
+        if cached is not None:
+            return Fighter.from_stats(cached, slug=slug)
+
+    parsed_url = parse(athlete_url(slug), transport=transport, backend=backend, partial=partial)
+    result = Fighter(parsed_url, compact=compact, slug=slug)
+    if cache is not None:
+        # Only the extracted record is kept, never the parsed page
+        cache.set(slug, result.stats)
+    return result
+
+def iter_fighters_by_fullname(fighters: Iterable[str], max_workers: int = 8, compact: bool = False, transport: Transport = None, backend: str = "bs4", partial: bool = False) -> Iterator["LookupResult"]:
+    """
+    Looks up many fighters over a bounded thread pool, yielding each result as it completes
+
+    A failed lookup is yielded as a :class:`LookupResult` carrying the error instead of aborting the batch
+    """
+    names = list(fighters)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(find_fighter_by_fullname, name, compact=compact, transport=transport, backend=backend, partial=partial): index
+            for index, name in enumerate(names)
+        }
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    yield LookupResult(names[index], index, fighter=future.result())
+                except Exception as error:
+                    yield LookupResult(names[index], index, error=error)
+        finally:
+            for future in futures:
+                future.cancel()
+
+def find_fighters_by_fullname(fighters: Iterable[str], max_workers: int = 8, compact: bool = False, transport: Transport = None, backend: str = "bs4", partial: bool = False) -> List["LookupResult"]:
+    """:class:`List[LookupResult]`: Looks up many fighters concurrently, returning the results in input order"""
+    return sorted(
+        iter_fighters_by_fullname(fighters, max_workers=max_workers, compact=compact, transport=transport, backend=backend, partial=partial),
+        key=lambda result: result.index,
+    )
+
+class LookupResult:
+    """The outcome of looking up a single fighter in a bulk lookup"""
+
+    __slots__ = ("name", "index", "fighter", "error")
+
+    def __init__(self, name: str, index: int, fighter: Optional["Fighter"] = None, error: Optional[Exception] = None):
+        self.name = name
+        self.index = index
+        self.fighter = fighter
+        self.error = error
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return f"<LookupResult name={self.name!r} {state}>"
+
+    @property
+    def ok(self) -> bool:
+        """:class:`bool`: Whether the fighter was found"""
+        return self.error is None
 
 class Fighter:
-    def __init__(self, _parsed_url: BeautifulSoup):
+    def __init__(self, _parsed_url: BeautifulSoup, compact: bool = False, slug: Optional[str] = None):
+        """
+        Represents a fighter on the UFC roster
+
+        ``_parsed_url`` is the athlete page as a BeautifulSoup or :mod:`lxml.html` tree.
+        With ``compact`` every field is extracted up front and the parsed page is released.
+        ``slug`` is the slug of the athlete page, guessed from the name when not given
+        """
         self._parsed_url = _parsed_url
-        self._bio = find_element(_parsed_url, "div", clas="c-bio__info-details")
+        self._record = None
+        self._slug = slug
+        if compact:
+            self.compact()
 
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def from_stats(cls, stats: FighterStats, slug: Optional[str] = None) -> "Fighter":
+        """:class:`Fighter`: A fighter holding its own copy of an already extracted record, without a parsed page"""
+        fighter = cls(None, slug=slug)
+        fighter._record = FighterStats(**stats.as_dict())
+        return fighter
+
+    @property
+    def stats(self) -> FighterStats:
+        """:class:`FighterStats`: Every value read off the athlete page, extracted in one pass on first access"""
+        if self._record is None:
+            self._record = extract_stats(self._parsed_url)
+        return self._record
+
+    def compact(self) -> None:
+        """Extracts every field now and drops the parsed page to free its memory"""
+        self.stats
+        self._parsed_url = None
+
+    @property
+    def slug(self) -> str:
+        """:class:`str`: The slug of the fighter's athlete page, e.g. ``jon-jones``"""
+        if self._slug is None:
+            self._slug = athlete_slug(self.name)
+        return self._slug
+
+    def fight_history(self, transport: Transport = None, prefetch: int = 3) -> Iterator[Bout]:
+        """
+        Yields the fighter's bouts one at a time, most recent first
+
+        The athlete page only shows a few bouts per "Load more" page, up to ``prefetch`` of the
+        next pages are fetched concurrently while the current one is read. No more pages are
+        requested once the caller stops iterating
+        """
+        return iter_history(self.slug, name=self.name, transport=transport, prefetch=prefetch)
+
     @property
     def name(self) -> str:
         """:class:`str`: The full name of the fighter"""
-        return (
-            find_element(self._parsed_url, "h1", clas="hero-profile__name")
-            .get_text()
-            .strip()
-        )
+        return self.stats.name
 
     @property
     def nickname(self) -> Optional[str]:
         """:class:`str`: The nickname of the fighter"""
-        try:
-            return (
-                find_element(self._parsed_url, "p", clas="hero-profile__nickname")
-                .get_text()
-                .strip('/"')
-            )
-        except:
-            return None
-        
+        return self.stats.nickname
+
     @property
     def age(self) -> int:
         """:class:`int`: The age of the fighter"""
-        return int(
-            self._bio.find("div", string="Age")
-            .find_next_sibling()
-            .get_text()
-            .strip()
-        )
-    
+        return self.stats.age
+
     @property
     def division(self) -> str:
         """:class:`str`: The division the fighter is currently particapting in"""
-        return (
-            find_element(self._parsed_url, "p", clas="hero-profile__division-title")
-            .get_text()
-            .strip()
-        )
+        return self.stats.division
 
     @property
     def gender(self) -> str:
         """:class:`str`: The gender of the fighter"""
-        if "Women's" in self.division:
+        if "Women's" in (self.division or ""):
             return "Woman"
         else:
             return "Man"
 
+    @property
+    def weight_class(self) -> str:
+        """:class:`str`: The weight class of the fighter's division, e.g. ``Light Heavyweight``"""
+        return split_division(self.division)[1]
+
     @property
     def record(self) -> str:
         """:class:`str`: The record of the fighter in the format of WIN-LOSS-DRAW"""
-        return (
-            find_element(self._parsed_url, "p", clas="hero-profile__division-body")
-            .get_text()
-            .split()[0]
-            .strip()
-        )
+        return self.stats.record
 
     @property
     def wins(self) -> int:
@@ -105,419 +214,294 @@ class Fighter:
     @property
     def weight(self) -> float:
         """:class:`float`: The weight the fighter likes to compete at"""
-        return float(
-            self._bio.find("div", string="Weight")
-            .find_next_sibling()
-            .get_text()
-            .strip()
-        )
+        return self.stats.weight
 
     @property
     def hometown(self) -> str:
         """:class:`str`: The hometown of the fighter"""
-        return (
-            self._bio.find("div", string="Hometown")
-            .find_next_sibling()
-            .get_text()
-            .strip()
-        )
+        return self.stats.hometown
 
     @property
     def activity(self) -> str:
         """:class:`str`: The activity of the fighter"""
-        return (
-            self._bio.find("div", string="Status")
-            .find_next_sibling()
-            .get_text()
-            .strip()
-        )
+        return self.stats.activity
 
     @property
     def image_url(self) -> str:
         """:class:`str`: A image of the fighter"""
-        return (
-            find_element(self._parsed_url, "img", clas="hero-profile__image")
-            .get("src") 
-        )
+        return self.stats.image_url
 
     @property
     def height_in_inch(self) -> Optional[float]:
         """Optional[:class:`float`]: The fighter's height in inches"""
-        try:
-            return float(
-                self._bio.find("div", string="Height")
-                .find_next_sibling()
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
-    
+        return self.stats.height_in_inch
+
     @property
     def height_in_feet(self) -> Optional[str]:
-        """Optional[:class:`str`]: The fighter's height in feet"""
-        try:
-            height_feet = round(self.height_in_inch / 12, 1)
-            new_height = str(height_feet).replace(".", " ").split(" ")
-            if new_height[1] == "0":
-                return f"{new_height[0]} foot"
-            else:
-                return f"{new_height[0]} foot {new_height[1]} inch"
-        except:
+        """Optional[:class:`str`]: The fighter's height in feet and inches, e.g. ``6 foot 4 inch``"""
+        if self.stats.height_feet is None:
+            return None
+        if self.stats.height_inches == 0:
+            return f"{self.stats.height_feet} foot"
+        return f"{self.stats.height_feet} foot {self.stats.height_inches} inch"
+
+    @property
+    def height_feet_inches(self) -> Optional[Tuple[int, int]]:
+        """Optional[:class:`Tuple[int, int]`]: The fighter's height as whole feet and the inches left over"""
+        if self.stats.height_feet is None:
             return None
+        return self.stats.height_feet, self.stats.height_inches
 
     @property
     def reach(self) -> Optional[str]:
         """Optional[:class:`str`]: The reach of the fighter"""
-        try:
-            return float(
-                self._bio.find("div", string="Reach")
-                .find_next_sibling()
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
+        return self.stats.reach
 
     @property
     def leg_reach(self) -> Optional[str]:
         """Optional[:class]:`str`: The leg reach of the fighter"""
-        try:
-            return float(
-                self._bio.find("div", string="Leg reach")
-                .find_next_sibling()
-                .get_text()
-            )
-        except:
-            return None
-        
+        return self.stats.leg_reach
+
     @property
     def octagon_debut(self) -> Optional[str]:
         """Optional[:class: `str`]: The date of when the fighter first fought in the UFC octagon"""
-        try:
-            return (
-                self._bio.find("div", string="Octagon Debut")
-                .find_next_sibling()
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
+        return self.stats.octagon_debut
+
+    @property
+    def octagon_debut_date(self) -> Optional[date]:
+        """Optional[:class:`datetime.date`]: The date of when the fighter first fought in the UFC octagon"""
+        return self.stats.octagon_debut_date
 
     @property
     def trains_at(self) -> Optional[str]:
         """Optional[:class: `str`]: The gym the UFC fighter currently trains out of"""
-        try:
-            return (
-                self._bio.find("div", string="Trains at")
-                .find_next_sibling()
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
+        return self.stats.trains_at
 
     @property
     def striking_accuracy(self) -> int:
         """:class:`int`: The striking accuracy percentage in the UFC career of the fighter"""
-        return int(
-            find_element(self._parsed_url, "text", clas="e-chart-circle__percent", find_all=True)
-            [0].get_text()
-            .strip("%")
-        )
+        return self.stats.striking_accuracy
 
     @property
     def significant_strikes_landed(self) -> int:
         """:class:`int`: The significant strikes landed in the UFC career of the fighter"""
-        return int(
-            find_element(self._parsed_url, "dl", clas="c-overlap__stats")
-            .find_next("dd")
-            .get_text()
-            .strip()
-        )
+        return self.stats.significant_strikes_landed
 
     @property
     def significant_strikes_attempted(self) -> int:
         """:class:`int`: The significant strikes attemped in the UFC career of the fighter"""
-        return int(
-            find_element(self._parsed_url, "dl", clas="c-overlap__stats")
-            .find_next_sibling()
-            .find_next("dd")
-            .get_text()
-            .strip()
-        )
+        return self.stats.significant_strikes_attempted
 
     @property
     def takedown_accuracy(self) -> int:
         """:class:`int`: The takedown accuracy percentage in the UFC career of the fighter"""
-        return int(
-            find_element(self._parsed_url, "text", clas="e-chart-circle__percent", find_all=True)
-            [1].get_text()
-            .strip("%")    
-        )
+        return self.stats.takedown_accuracy
 
     @property
     def landed_takedowns(self) -> Optional[int]:
         """Optional[:class:`int`]: The takedowns landed in the UFC career of the fighter"""
-        try:
-            return int(
-                find_element(self._parsed_url, "dl", clas="c-overlap__stats", find_all=True)
-                [2].find_next("dd")
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
+        return self.stats.landed_takedowns
 
     @property
     def attempted_takedowns(self) -> Optional[int]:
         """Optional[:class:`str`]: The takedowns attempted in the UFC career of the fighter"""
-        try:
-            return int(
-                find_element(self._parsed_url, "dl", clas="c-overlap__stats", find_all=True)
-                [3].find_next("dd")
-                .get_text()
-                .strip()
-            )
-        except:
-            return None
-        
+        return self.stats.attempted_takedowns
+
     @property
     def wins_by_ko(self) -> int:
         """:class:`int`: The amount of the knockout wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [3].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.wins_by_ko
+
     @property
     def wins_by_ko_percentage(self) -> int:
         """:class:`int`: The percentage of the knockout wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [3].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
-        
+        return self.stats.wins_by_ko_percentage
+
     @property
     def wins_by_sub(self) -> int:
         """:class:`int`: The amount of the submission wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [5].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.wins_by_sub
+
     @property
     def wins_by_sub_percentage(self) -> int:
         """:class:`int`: The percentage of the submission wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [5].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
-        
+        return self.stats.wins_by_sub_percentage
+
     @property
     def wins_by_dec(self) -> int:
         """:class:`int`: The amount of the decision wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [4].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.wins_by_dec
+
     @property
     def wins_by_dec_percentage(self) -> int:
         """:class:`int`: The percentage of the decision wins the fighter has in the UFC"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [4].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
-        
+        return self.stats.wins_by_dec_percentage
+
     @property
     def sig_str_landed_min(self) -> float:
         """:class:`float`: The amount of signfication strikes the figher lands per minute"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [0].get_text()
-            .strip()
-        )
-    
+        return self.stats.sig_str_landed_min
+
     @property
     def sig_str_absorbed_min(self) -> float:
         """:class:`float`: The amount of signfication strikes the figher absorbs per minute"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [1].get_text()
-            .strip()
-        )
+        return self.stats.sig_str_absorbed_min
 
     @property
     def takedown_avg(self) -> float:
         """:class:`float`: The average amount of takedowns the figher lands per fight"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [2].get_text()
-            .strip()
-        )
+        return self.stats.takedown_avg
 
     @property
     def submission_avg(self) -> float:
         """:class:`float`: The average amount of submissions the figher lands per fight"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [3].get_text()
-            .strip()
-        )
+        return self.stats.submission_avg
 
     @property
     def sig_str_defense(self) -> int:
         """:class:`int`: The percentage of signfication strikes the figher defends against in whole UFC career"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [4].get_text()
-            .strip()
-        )
+        return self.stats.sig_str_defense
 
     @property
     def takedown_defense(self) -> int:
         """:class:`int`: The percentage of takedowns the figher defends against in whole UFC career"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [5].get_text()
-            .strip()
-        )
+        return self.stats.takedown_defense
 
     @property
     def knockdown_avg(self) -> float:
         """:class:`float`: The amount of knockdowns the figher lands per a 15 minute window"""
-        return float(
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [6].get_text()
-            .strip()
-        )
-    
+        return self.stats.knockdown_avg
+
     @property
     def average_fight_time(self) -> str:
         """:class:`str`: The average amount of time the fighter spends in octagon per fight"""
-        return (
-            find_element(self._parsed_url, "div", clas="c-stat-compare__number", find_all=True)
-            [7].get_text()
-            .strip()
-        )
-    
+        return self.stats.average_fight_time
+
+    @property
+    def average_fight_seconds(self) -> Optional[int]:
+        """Optional[:class:`int`]: The average amount of time the fighter spends in octagon per fight, in seconds"""
+        return self.stats.average_fight_seconds
+
     @property
     def sig_str_via_standing(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown in a standing position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [0].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.sig_str_via_standing
+
     @property
     def sig_str_percentage_via_standing(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown in a standing position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [0].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
-    
+        return self.stats.sig_str_percentage_via_standing
+
     @property
     def sig_str_via_clinch(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown in a clinch position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [1].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.sig_str_via_clinch
+
     @property
     def sig_str_percentage_via_clinch(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown in a clinch position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [1].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
+        return self.stats.sig_str_percentage_via_clinch
 
     @property
     def sig_str_via_ground(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown in a ground position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [2].get_text()
-            .split(" ")[0]
-        )
-    
+        return self.stats.sig_str_via_ground
+
     @property
     def sig_str_percentage_via_ground(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown in a ground position"""
-        return int(
-            find_element(self._parsed_url, "div", clas="c-stat-3bar__value", find_all=True)
-            [2].get_text()
-            .split(" ")[1]
-            .strip("(%)")
-        )
-    
+        return self.stats.sig_str_percentage_via_ground
+
     @property
     def sig_str_to_head(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown to the head"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_head_value")
-            .get_text()
-            .strip()
-        )
-    
+        return self.stats.sig_str_to_head
+
     @property
     def sig_str_percentage_to_head(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown to the head"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_head_percent")
-            .get_text()
-            .strip("%")
-        )
-    
+        return self.stats.sig_str_percentage_to_head
+
     @property
     def sig_str_to_body(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown to the body"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_body_value")
-            .get_text()
-            .strip()
-        )
-    
+        return self.stats.sig_str_to_body
+
     @property
     def sig_str_percentage_to_body(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown to the body"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_body_percent")
-            .get_text()
-            .strip("%")
-        )
-    
+        return self.stats.sig_str_percentage_to_body
+
     @property
     def sig_str_to_leg(self) -> int:
         """:class:`int`: The amount of significant strikes the fighter has thrown to the leg"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_leg_value")
-            .get_text()
-            .strip()
-        )
-    
+        return self.stats.sig_str_to_leg
+
     @property
     def sig_str_percentage_to_leg(self) -> int:
         """:class:`int`: The percentage of significant strikes the fighter has thrown to the leg"""
-        return int(
-            find_element(self._parsed_url, "text", id="e-stat-body_x5F__x5F_leg_percent")
-            .get_text()
-            .strip("%")
-        )
\ No newline at end of file
+        return self.stats.sig_str_percentage_to_leg
+
+
+class LazyFighter(Fighter):
+    def __init__(self, card: AthleteCard, transport: Transport = None, backend: str = "bs4", partial: bool = False):
+        """
+        A fighter known from their listing card, whose profile is only fetched when needed
+
+        ``name``, ``division``, ``record`` and ``image_url`` come from the card, reading
+        any other field loads the full profile once, parsed with ``backend`` and ``partial``
+        """
+        super().__init__(None, slug=card.slug)
+        self.card = card
+        self._transport = transport
+        self._backend = backend
+        self._partial = partial
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<LazyFighter name={self.card.name!r} loaded={self.loaded}>"
+
+    @property
+    def loaded(self) -> bool:
+        """:class:`bool`: Whether the full profile has been fetched"""
+        return self._record is not None
+
+    def load(self, stats: Optional[FighterStats] = None) -> "LazyFighter":
+        """Fetches the full profile now if it has not been already, or takes a copy of ``stats`` already at hand instead"""
+        if stats is not None and self._record is None:
+            with self._lock:
+                if self._record is None:
+                    self._record = FighterStats(**stats.as_dict())
+        self.stats
+        return self
+
+    @property
+    def stats(self) -> FighterStats:
+        """:class:`FighterStats`: Every value read off the athlete page, fetched on first access"""
+        if self._record is None:
+            with self._lock:
+                if self._record is None:
+                    self._record = find_fighter_by_slug(
+                        self.card.slug, transport=self._transport, backend=self._backend, partial=self._partial
+                    ).stats
+        return self._record
+
+    @property
+    def name(self) -> str:
+        """:class:`str`: The full name of the fighter"""
+        return self.card.name
+
+    @property
+    def division(self) -> str:
+        """:class:`str`: The division the fighter is currently particapting in"""
+        return self.card.division or self.stats.division
+
+    @property
+    def record(self) -> str:
+        """:class:`str`: The record of the fighter in the format of WIN-LOSS-DRAW"""
+        return self.card.record or self.stats.record
+
+    @property
+    def image_url(self) -> str:
+        """:class:`str`: A image of the fighter"""
+        return self.card.image_url or self.stats.image_url
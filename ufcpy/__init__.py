@@ -7,8 +7,18 @@ A wrapper for the UFC website
 :license: MIT. See LICENSE for more details 
 """
 
-from .Fighter import find_fighter_by_fullname
+from .Fighter import find_fighter_by_fullname, find_fighter_by_slug, find_fighters_by_fullname, iter_fighters_by_fullname, LazyFighter, LookupResult
+from .history import Bout
+from .listing import AthleteCard
+from .names import NameIndex, get_name_index, normalize_name, set_name_index
+from .stats import FighterStats
+from .export import StatsTable
+from .snapshot import Snapshot, SnapshotFighter, write_snapshot
 from .Champion import *
+from .Event import Event, EventBout
+from .transport import Transport, get_transport, set_transport
+from .scheduler import Scheduler, get_scheduler, set_scheduler
+from .cache import DiskCache, FighterCache, get_fighter_cache, set_fighter_cache
 from .exceptions import *
 
 __title__ = "ufcpy"
@@ -0,0 +1,192 @@
+"""
+Asyncio client for the UFC website
+
+Requires :mod:`aiohttp`, install it with ``pip install ufcpy[aio]``
+"""
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Iterable, List, Optional
+
+try:
+    import aiohttp
+except ImportError as error:
+    raise ImportError("ufcpy.aio requires aiohttp, install it with `pip install ufcpy[aio]`") from error
+
+from .Champion import Champion, parse_titleholders
+from .cache import get_fighter_cache
+from .Fighter import Fighter
+from .core import parse_content
+from .listing import AthleteCard
+from .names import resolve_slug
+from .scheduler import THROTTLED_STATUSES, Scheduler, get_scheduler, retry_after
+from .utils import athlete_url, check_status_codes, check_throttled
+
+
+def _build_fighter(content: bytes, compact: bool, slug: str) -> Fighter:
+    return Fighter(parse_content(content), compact=compact, slug=slug)
+
+
+def _champion_cards(content: bytes) -> List[AthleteCard]:
+    return Champion(parse_titleholders(content)).all_cards()
+
+
+class Client:
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        pool_size: int = 100,
+        session: Optional[aiohttp.ClientSession] = None,
+        executor: Optional[Executor] = None,
+        scheduler: Optional[Scheduler] = None,
+    ):
+        """
+        An asyncio client sharing one connection pool between every request
+
+        At most ``max_concurrency`` requests are in flight at once and pages are parsed
+        in ``executor`` (the loop's default thread pool when omitted) so the event loop never blocks.
+
+        Every request also waits for its turn from ``scheduler``, the shared one from :func:`get_scheduler`
+        when not given, so the client and every :class:`Transport` go by the same host limits, pauses and retries
+        """
+        self._session = session
+        self._owns_session = session is None
+        self._pool_size = pool_size
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._executor = executor
+        self.scheduler = scheduler
+
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """:class:`aiohttp.ClientSession`: The session every request goes through"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the session if the client created it"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
+    async def fetch(self, url: str) -> bytes:
+        """:class:`bytes`: The body of ``url`` once the redirect check has passed, raises :class:`UFCPyError` when still throttled"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        scheduler = self.scheduler or get_scheduler()
+        queue = scheduler.host(url)
+        for attempt in range(scheduler.retries + 1):
+            async with self._semaphore:
+                await queue.acquire_async()
+                start = time.monotonic()
+                try:
+                    async with self.session.get(url) as res:
+                        status, wait = res.status, retry_after(res)
+                        if status not in THROTTLED_STATUSES:
+                            check_status_codes(r.status for r in res.history)
+                            res.raise_for_status()
+                            content = await res.read()
+                except BaseException:
+                    # Cancelled or failed, the slot is freed all the same
+                    queue.release(start)
+                    raise
+                queue.release(start, status, wait)
+            if status not in THROTTLED_STATUSES:
+                return content
+            if attempt == scheduler.retries:
+                check_throttled(status)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def fetch_fighter(self, fighter: str, compact: bool = False) -> Fighter:
+        """:class:`Fighter`: Looks a fighter up by their full name, sharing the sync API's fighter cache"""
+        return await self.fetch_fighter_by_slug(resolve_slug(fighter), compact)
+
+    async def fetch_fighter_by_slug(self, slug: str, compact: bool = False) -> Fighter:
+        """:class:`Fighter`: Looks a fighter up by the slug of their athlete page, e.g. ``jon-jones``"""
+        cache = get_fighter_cache()
+        if cache is not None:
+            cached = cache.get(slug)
+            if cached is not None:
+                return Fighter.from_stats(cached, slug=slug)
+
+        content = await self.fetch(athlete_url(slug))
+        result = await self._run(_build_fighter, content, compact, slug)
+        if cache is not None:
+            cache.set(slug, result.stats)
+        return result
+
+    async def fetch_fighters(self, fighters: Iterable[str], compact: bool = False) -> list:
+        """
+        :class:`list`: Looks many fighters up concurrently, in input order
+
+        A failed lookup is returned as its exception instead of cancelling the others
+        """
+        return await asyncio.gather(
+            *(self.fetch_fighter(fighter, compact) for fighter in fighters),
+            return_exceptions=True,
+        )
+
+    async def _fetch_champion_cards(self) -> List[AthleteCard]:
+        content = await self.fetch(Champion.BASE_URL)
+        return await self._run(_champion_cards, content)
+
+    async def fetch_champion_names(self) -> List[str]:
+        """:class:`List[str]`: All of the current champions names, read off their listing cards"""
+        return [card.name for card in await self._fetch_champion_cards()]
+
+    async def fetch_champions(self, compact: bool = False) -> List[Fighter]:
+        """:class:`List[Fighter]`: All of the current champions, fetched concurrently"""
+        cards = await self._fetch_champion_cards()
+        return list(
+            await asyncio.gather(*(self.fetch_fighter_by_slug(card.slug, compact) for card in cards))
+        )
+
+
+_clients = {}
+
+
+def _default_client() -> Client:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        for stale in [other for other in _clients if other.is_closed()]:
+            del _clients[stale]
+        client = _clients[loop] = Client()
+    return client
+
+
+async def close() -> None:
+    """Closes the shared client of the running event loop"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+async def fetch_fighter(fighter: str, compact: bool = False) -> Fighter:
+    """:class:`Fighter`: Looks a fighter up by their full name using the shared client"""
+    return await _default_client().fetch_fighter(fighter, compact)
+
+
+async def fetch_fighter_by_slug(slug: str, compact: bool = False) -> Fighter:
+    """:class:`Fighter`: Looks a fighter up by the slug of their athlete page using the shared client"""
+    return await _default_client().fetch_fighter_by_slug(slug, compact)
+
+
+async def fetch_fighters(fighters: Iterable[str], compact: bool = False) -> list:
+    """:class:`list`: Looks many fighters up concurrently using the shared client"""
+    return await _default_client().fetch_fighters(fighters, compact)
+
+
+async def fetch_champions(compact: bool = False) -> List[Fighter]:
+    """:class:`List[Fighter]`: All of the current champions using the shared client"""
+    return await _default_client().fetch_champions(compact)
@@ -0,0 +1,163 @@
+"""
+Vectorized analytics over the stats of many fighters
+
+Requires :mod:`numpy`, install it with ``pip install ufcpy[numpy]``
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("ufcpy.analytics requires numpy, install it with `pip install ufcpy[numpy]`") from error
+
+from .exceptions import UFCPyError
+from .export import COLUMN_TYPES, StatsTable
+
+NUMERIC_COLUMNS = tuple(column for column, kind in COLUMN_TYPES.items() if kind in ("int64", "float64"))
+AGGREGATES = ("count", "mean", "std", "min", "max", "median")
+
+
+class RosterStats:
+    def __init__(self, fighters: Union[StatsTable, Iterable]):
+        """
+        The numeric stats of many fighters held as one ``float64`` array per field
+
+        ``fighters`` is a :class:`StatsTable` or anything it accepts. Missing values are ``NaN``
+        and are left out of every aggregate, rank and score. Fighters are grouped by their division title.
+        """
+        table = fighters if isinstance(fighters, StatsTable) else StatsTable(fighters)
+        self.names = np.array(["" if name is None else name for name in table["name"]], dtype=str)
+        divisions = ["" if division is None else division for division in table["division"]]
+        self.divisions, self._codes = np.unique(np.array(divisions, dtype=str), return_inverse=True)
+        self._codes = self._codes.ravel()
+        self._columns = {
+            column: np.fromiter(
+                (np.nan if value is None else value for value in table[column]), dtype=np.float64, count=len(table)
+            )
+            for column in NUMERIC_COLUMNS
+        }
+        self._positions = {name: index for index, name in enumerate(self.names)}
+
+    def __repr__(self) -> str:
+        return f"<RosterStats fighters={len(self)} divisions={len(self.divisions)}>"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def column(self, column: str) -> "np.ndarray":
+        """:class:`numpy.ndarray`: The values of a numeric field for every fighter, ``NaN`` when missing"""
+        try:
+            return self._columns[column]
+        except KeyError:
+            raise UFCPyError(f"{column!r} is not a numeric stat") from None
+
+    def _group_sums(self, values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        valid = ~np.isnan(values)
+        groups = len(self.divisions)
+        counts = np.bincount(self._codes, weights=valid, minlength=groups)
+        filled = np.where(valid, values, 0.0)
+        sums = np.bincount(self._codes, weights=filled, minlength=groups)
+        squares = np.bincount(self._codes, weights=filled * filled, minlength=groups)
+        return counts, sums, squares
+
+    def _group_moments(self, values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        counts, sums, squares = self._group_sums(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+            stds = np.sqrt(np.maximum(squares / counts - means * means, 0.0))
+        return counts, means, stds
+
+    def by_division(self, column: str) -> Dict[str, Dict[str, float]]:
+        """
+        :class:`Dict[str, Dict[str, float]]`: The count, mean, standard deviation, min, max and median
+        of a field within every division
+        """
+        values = self.column(column)
+        counts, means, stds = self._group_moments(values)
+        order = np.lexsort((values, self._codes))
+        sorted_values = values[order]
+        bounds = np.searchsorted(self._codes[order], np.arange(len(self.divisions) + 1))
+
+        result = {}
+        for code, division in enumerate(self.divisions):
+            # NaN sorts last, so the valid values of a division are the head of its slice
+            group = sorted_values[bounds[code]:bounds[code] + int(counts[code])]
+            empty = len(group) == 0
+            result[str(division)] = {
+                "count": int(counts[code]),
+                "mean": float(means[code]),
+                "std": float(stds[code]),
+                "min": np.nan if empty else float(group[0]),
+                "max": np.nan if empty else float(group[-1]),
+                "median": np.nan if empty else float(np.median(group)),
+            }
+        return result
+
+    def percentile_ranks(self, column: str, by_division: bool = True) -> "np.ndarray":
+        """
+        :class:`numpy.ndarray`: Every fighter's percentile rank (0 to 100) for a field, within their division by default
+
+        Ties share the mean of their ranks, fighters missing the field get ``NaN``
+        """
+        values = self.column(column)
+        codes = self._codes if by_division else np.zeros(len(values), dtype=np.intp)
+        valid = ~np.isnan(values)
+        ranks = np.full(len(values), np.nan)
+        if not valid.any():
+            return ranks
+
+        # One integer key per (division, value) so a single sorted array answers every group at once
+        _, dense = np.unique(values[valid], return_inverse=True)
+        width = dense.max() + 2
+        keys = codes[valid].astype(np.int64) * width + dense.ravel()
+        sorted_keys = np.sort(keys)
+        below = np.searchsorted(sorted_keys, keys, side="left")
+        through = np.searchsorted(sorted_keys, keys, side="right")
+        starts = np.searchsorted(sorted_keys, codes[valid].astype(np.int64) * width, side="left")
+        counts = np.bincount(codes[valid])[codes[valid]]
+        ranks[valid] = ((below - starts) + (through - starts)) / 2.0 / counts * 100.0
+        return ranks
+
+    def zscores(self, column: str, by_division: bool = True) -> "np.ndarray":
+        """
+        :class:`numpy.ndarray`: How many standard deviations every fighter is from the mean of a field,
+        within their division by default. ``NaN`` for missing values and divisions without spread
+        """
+        values = self.column(column)
+        if not by_division:
+            mean = np.nanmean(values) if (~np.isnan(values)).any() else np.nan
+            std = np.nanstd(values) if (~np.isnan(values)).any() else np.nan
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(std > 0, (values - mean) / std, np.nan)
+        _, means, stds = self._group_moments(values)
+        means, stds = means[self._codes], stds[self._codes]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(stds > 0, (values - means) / stds, np.nan)
+
+    def rankings(self, column: str, division: Optional[str] = None, ascending: bool = False, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """:class:`List[Tuple[str, float]]`: Fighters ordered by a field, best first, optionally within one division"""
+        values = self.column(column)
+        candidates = np.flatnonzero(~np.isnan(values))
+        if division is not None:
+            candidates = candidates[self.divisions[self._codes[candidates]] == division]
+        order = np.argsort(values[candidates] if ascending else -values[candidates], kind="stable")
+        picked = candidates[order[:limit]]
+        return [(str(self.names[index]), float(values[index])) for index in picked]
+
+    def indices(self, names: Sequence[str]) -> "np.ndarray":
+        """:class:`numpy.ndarray`: The positions of fighters by name"""
+        try:
+            return np.array([self._positions[name] for name in names], dtype=np.intp)
+        except KeyError as error:
+            raise UFCPyError(f"{error.args[0]!r} is not in these stats") from None
+
+    def matchup_matrix(self, column: str, names: Optional[Sequence[str]] = None) -> "np.ndarray":
+        """
+        :class:`numpy.ndarray`: The N×N differential of a field, ``matrix[i, j]`` is fighter ``i`` minus fighter ``j``
+
+        Covers every fighter, or only ``names`` in that order. A missing value makes its row and column ``NaN``
+        """
+        values = self.column(column)
+        if names is not None:
+            values = values[self.indices(names)]
+        return values[:, None] - values[None, :]
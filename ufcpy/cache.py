@@ -0,0 +1,229 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+class CacheEntry:
+    """A page body stored by :class:`DiskCache` along with its validators"""
+
+    __slots__ = ("url", "body", "etag", "last_modified", "expires")
+
+    def __init__(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str], expires: float):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        """:class:`bool`: Whether the entry can be served without revalidating"""
+        return time.time() < self.expires
+
+    def validators(self) -> dict:
+        """:class:`dict`: The conditional request headers to revalidate the entry with"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """:class:`requests.Response`: The entry as a response with an empty redirect history"""
+        res = requests.Response()
+        res.status_code = 200
+        res.url = self.url
+        res._content = self.body
+        res.headers = CaseInsensitiveDict()
+        if self.etag:
+            res.headers["ETag"] = self.etag
+        if self.last_modified:
+            res.headers["Last-Modified"] = self.last_modified
+        return res
+
+
+class DiskCache:
+    def __init__(self, path: str, ttl: float = 3600.0, max_bytes: int = 512 * 1024 * 1024):
+        """
+        A persistent, size bounded response cache stored in a single SQLite file
+
+        Entries are served as is for ``ttl`` seconds and revalidated with a conditional
+        GET afterwards. Once the stored bodies exceed ``max_bytes`` the least recently
+        used ones are evicted. SQLite locking makes the file safe to share between
+        threads and processes.
+        """
+        self.path = path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Optional[:class:`CacheEntry`]: The stored entry for ``url``, fresh or stale"""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE url = ?", (time.time(), url))
+        return CacheEntry(url, *row)
+
+    def set(self, url: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """Stores a page body, evicting the least recently used entries when over the size bound"""
+        now = time.time()
+        expires = now + (self.ttl if ttl is None else ttl)
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, sqlite3.Binary(body), etag, last_modified, expires, now, len(body)),
+            )
+            self._evict(conn)
+
+    def refresh(self, url: str, ttl: Optional[float] = None) -> None:
+        """Marks an entry fresh again, used after the server answers a revalidation with a 304"""
+        now = time.time()
+        expires = now + (self.ttl if ttl is None else ttl)
+        with self._connection() as conn:
+            conn.execute(
+                "UPDATE responses SET expires = ?, accessed = ? WHERE url = ?", (expires, now, url)
+            )
+
+    def delete(self, url: str) -> None:
+        """Removes the entry for ``url``"""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def clear(self) -> None:
+        """Removes every entry"""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    @property
+    def size(self) -> int:
+        """:class:`int`: The total size of the stored bodies in bytes"""
+        with self._connection() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY accessed").fetchall():
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+class FighterCache:
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 600.0):
+        """
+        A thread safe, in-memory LRU cache of looked up fighters' stats records
+
+        Holds at most ``maxsize`` entries, each for ``ttl`` seconds (forever when ``None``)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, count=False) is not None
+
+    def get(self, key: Hashable, count: bool = True) -> Optional[Any]:
+        """The cached value for ``key`` or ``None`` when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[1] >= self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores ``value``, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops the entry for ``key`` if there is one"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry and resets the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def info(self) -> dict:
+        """:class:`dict`: The hit and miss counters along with the current size"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self), "maxsize": self.maxsize}
+
+
+_fighter_cache = FighterCache()
+
+
+def get_fighter_cache() -> Optional[FighterCache]:
+    """Optional[:class:`FighterCache`]: The cache used by :func:`find_fighter_by_fullname`, ``None`` when disabled"""
+    return _fighter_cache
+
+
+def set_fighter_cache(cache: Optional[FighterCache]) -> None:
+    """Replaces the fighter cache, ``None`` disables caching"""
+    global _fighter_cache
+    _fighter_cache = cache
@@ -1,12 +1,45 @@
+from .transport import Transport, get_transport
 from .utils import check_response
 
-import requests
+import lxml.html
 from bs4 import BeautifulSoup
 
-def parse(url: str):
-    res = requests.get(url)
+from .exceptions import UFCPyError
+from .partial import SectionParser, parse_sections
+
+# "bs4" builds a BeautifulSoup tree on top of lxml, "lxml" keeps lxml's own tree and skips that second pass
+BACKENDS = ("bs4", "lxml")
+
+def fetch(url: str, transport: Transport = None) -> bytes:
+    res = (transport or get_transport()).get(url)
     check_response(res)
-    parsed_url = BeautifulSoup(res.content, "lxml")
+    return res.content
+
+def fetch_sections(url: str, transport: Transport = None):
+    """
+    Streams an athlete page into a :class:`SectionParser`, closing the connection once every field is read
+
+    A page the transport already holds whole, cached or replayed, goes through :func:`parse_sections` instead
+    """
+    parser = SectionParser()
+    pages = []
+    (transport or get_transport()).stream(url, parser.feed, consume_whole=pages.append)
+    return parse_sections(pages[0]) if pages else parser.close()
+
+def parse(url: str, transport: Transport = None, backend: str = "bs4", partial: bool = False):
+    if partial and backend == "lxml":
+        return fetch_sections(url, transport=transport)
+    return parse_content(fetch(url, transport=transport), backend=backend, partial=partial)
+
+def parse_content(content: bytes, backend: str = "bs4", partial: bool = False):
+    if backend not in BACKENDS:
+        raise UFCPyError(f"Unknown parser backend {backend!r}, expected one of {BACKENDS}")
+    if partial:
+        # Only the hero, bio and stat sections an athlete page is read for
+        return parse_sections(content, backend=backend)
+    if backend == "lxml":
+        return lxml.html.document_fromstring(content)
+    parsed_url = BeautifulSoup(content, "lxml")
     return parsed_url
 
 def find_element(parsed_url: BeautifulSoup, element, id = None, clas = None, find_all: bool = False, *args, **kwargs):
@@ -0,0 +1,127 @@
+"""
+Columnar export of fighter stats for analytics
+
+:meth:`StatsTable.to_csv` only needs the standard library, :meth:`StatsTable.to_numpy` needs numpy
+(``pip install ufcpy[numpy]``) and :meth:`StatsTable.to_arrow` and :meth:`StatsTable.to_parquet`
+need pyarrow (``pip install ufcpy[arrow]``)
+"""
+import csv
+import importlib
+from datetime import date
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple, Union
+
+from .Fighter import LookupResult
+from .exceptions import UFCPyError
+from .stats import FIELDS, FighterStats
+
+# The column type of every field, from the type its value is converted to when extracted
+COLUMN_TYPES = {spec.name: {int: "int64", float: "float64", date: "date"}.get(spec.type, "string") for spec in FIELDS}
+
+
+def _require(module: str, extra: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(f"This export requires {module}, install it with `pip install ufcpy[{extra}]`") from error
+
+
+def _iter_stats(fighters: Iterable) -> Iterator[Tuple[Optional[str], FighterStats]]:
+    # A bare record doesn't know its athlete page, a fighter does
+    for item in fighters:
+        if isinstance(item, LookupResult):
+            if not item.ok:
+                continue
+            item = item.fighter
+        if isinstance(item, FighterStats):
+            yield None, item
+        else:
+            yield item.slug, item.stats
+
+
+class StatsTable:
+    def __init__(self, fighters: Iterable, columns: Optional[Sequence[str]] = None):
+        """
+        The stats of many fighters held column by column, collected in a single pass
+
+        ``fighters`` can hold :class:`Fighter` objects, :class:`FighterStats` records or the
+        :class:`LookupResult` of a bulk lookup, failed lookups are skipped. ``columns`` picks
+        which fields to keep, every field by default. Missing values are kept as nulls in every output.
+        :attr:`slugs` holds each row's athlete page slug, ``None`` for a row made from a bare record
+        """
+        self.columns = tuple(columns or COLUMN_TYPES)
+        unknown = [column for column in self.columns if column not in COLUMN_TYPES]
+        if unknown:
+            raise UFCPyError(f"Unknown stat columns {unknown}")
+
+        getter = attrgetter(*self.columns)
+        slugs = []
+        rows = []
+        for slug, stats in _iter_stats(fighters):
+            slugs.append(slug)
+            rows.append(getter(stats))
+        self.slugs = tuple(slugs)
+        if len(self.columns) == 1:
+            rows = [(row,) for row in rows]
+        self._data = dict(zip(self.columns, zip(*rows))) if rows else dict.fromkeys(self.columns, ())
+        self._size = len(rows)
+
+    def __repr__(self) -> str:
+        return f"<StatsTable rows={self._size} columns={len(self.columns)}>"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, column: str) -> Tuple:
+        return self._data[column]
+
+    def rows(self) -> Iterator[Tuple]:
+        """Every fighter's values as a tuple, in :attr:`columns` order"""
+        return zip(*(self._data[column] for column in self.columns))
+
+    def to_numpy(self) -> Dict[str, "numpy.ma.MaskedArray"]:
+        """
+        :class:`Dict[str, numpy.ma.MaskedArray]`: One typed masked array per column
+
+        Numeric columns are ``int64`` or ``float64``, dates ``datetime64[D]`` and strings unicode, a missing value is masked
+        """
+        np = _require("numpy", "numpy")
+        arrays = {}
+        for column in self.columns:
+            values = self._data[column]
+            mask = np.fromiter((value is None for value in values), dtype=bool, count=self._size)
+            kind = COLUMN_TYPES[column]
+            if kind == "string":
+                data = np.array(["" if value is None else value for value in values], dtype=str)
+            elif kind == "date":
+                data = np.array(values, dtype="datetime64[D]")
+            else:
+                fill = 0 if kind == "int64" else float("nan")
+                data = np.fromiter(
+                    (fill if value is None else value for value in values), dtype=kind, count=self._size
+                )
+            arrays[column] = np.ma.masked_array(data, mask=mask)
+        return arrays
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """:class:`pyarrow.Table`: The table with typed, nullable columns"""
+        pa = _require("pyarrow", "arrow")
+        types = {"int64": pa.int64(), "float64": pa.float64(), "date": pa.date32(), "string": pa.string()}
+        return pa.table(
+            {column: pa.array(self._data[column], type=types[COLUMN_TYPES[column]]) for column in self.columns}
+        )
+
+    def to_parquet(self, path: str, **kwargs) -> None:
+        """Writes the table to a Parquet file, ``kwargs`` go to :func:`pyarrow.parquet.write_table`"""
+        pq = _require("pyarrow.parquet", "arrow")
+        pq.write_table(self.to_arrow(), path, **kwargs)
+
+    def to_csv(self, file: Union[str, TextIO]) -> None:
+        """Writes the table as CSV with a header row to a path or an open text file, missing values are left empty"""
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as fh:
+                self.to_csv(fh)
+            return
+        writer = csv.writer(file)
+        writer.writerow(self.columns)
+        writer.writerows(self.rows())
@@ -0,0 +1,205 @@
+"""
+Bout-by-bout fight history read off the "Athlete Record" listing of an athlete page
+
+The listing is paginated, ``?page=1``, ``?page=2`` and so on each render the next bouts behind
+the "Load more" button. Pages are streamed into :class:`HistoryParser`, which only builds the
+result cards and hangs up once the listing is over.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Iterator, List, Optional
+
+from lxml import etree
+
+from .listing import read_result
+from .names import normalize_name
+from .partial import HTML_CLASS_LOOKUP
+from .stats import parse_date
+from .transport import Transport, get_transport
+from .utils import athlete_url
+
+LISTING_CLASS = "l-listing--stacked"
+CARD_CLASS = "c-card-event--athlete-results"
+RESULTS = {"win": "Win", "loss": "Loss", "draw": "Draw", "nc": "No Contest", "no-contest": "No Contest"}
+
+
+def _classes(element) -> List[str]:
+    return (element.get("class") or "").split()
+
+
+def _by_class(element, name: str) -> list:
+    return element.xpath(f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {CARD_CLASS}__{name} ')]")
+
+
+def _text(element, name: str) -> Optional[str]:
+    found = _by_class(element, name)
+    return (found[0].text_content().strip() or None) if found else None
+
+
+def _path_slug(href: Optional[str]) -> Optional[str]:
+    if not href:
+        return None
+    return href.split("#")[0].split("?")[0].rstrip("/").rsplit("/", 1)[-1] or None
+
+
+class Bout:
+    """A single bout of a fighter's history, as shown on their athlete page"""
+
+    __slots__ = ("opponent", "opponent_slug", "event_slug", "date", "result", "method", "round", "time")
+
+    def __init__(
+        self,
+        opponent: Optional[str] = None,
+        opponent_slug: Optional[str] = None,
+        event_slug: Optional[str] = None,
+        date: Optional[date] = None,
+        result: Optional[str] = None,
+        method: Optional[str] = None,
+        round: Optional[int] = None,
+        time: Optional[str] = None,
+    ):
+        self.opponent = opponent
+        self.opponent_slug = opponent_slug
+        self.event_slug = event_slug
+        self.date = date
+        self.result = result
+        self.method = method
+        self.round = round
+        self.time = time
+
+    def __repr__(self) -> str:
+        return f"<Bout opponent={self.opponent!r} date={self.date} result={self.result!r}>"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Bout):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def as_dict(self) -> dict:
+        """:class:`dict`: Every field of the bout keyed by name"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class HistoryParser:
+    def __init__(self, slug: str, name: Optional[str] = None):
+        """
+        Incrementally parses one page of a fighter's listing into :class:`Bout` objects
+
+        Only the result cards are kept, each is read and dropped as soon as it is closed.
+        ``slug`` and ``name`` tell the fighter's corner from their opponent's, the site
+        sometimes links a corner with only a last name or an unexpected URL
+        """
+        self.slug = slug
+        self.name = normalize_name(name) if name else None
+        self.bouts: List[Bout] = []
+        self.has_next = False
+        self.done = False
+        self._depth = 0
+        self._parser = etree.HTMLPullParser(events=("start", "end"), tag=("section", "article", "a"))
+        self._parser.set_element_class_lookup(HTML_CLASS_LOOKUP)
+
+    def feed(self, chunk: bytes) -> bool:
+        """:class:`bool`: Parses the next chunk of the page, ``True`` once the listing has been read"""
+        if self.done:
+            return True
+        self._parser.feed(chunk)
+        for event, element in self._parser.read_events():
+            if element.tag == "section" and LISTING_CLASS in _classes(element):
+                self._depth += 1 if event == "start" else -1
+                if event == "end" and self._depth == 0:
+                    self.done = True
+                    break
+            elif not self._depth or event != "end":
+                continue
+            elif element.tag == "article" and CARD_CLASS in _classes(element):
+                self.bouts.append(self._bout(element))
+                element.clear()
+            elif element.tag == "a" and element.get("rel") == "next":
+                self.has_next = True
+        return self.done
+
+    def close(self) -> List[Bout]:
+        """:class:`List[Bout]`: Every bout read off the page"""
+        if not self.done:
+            self._parser.close()
+        return self.bouts
+
+    def _is_fighter(self, corner) -> bool:
+        if _path_slug(corner.get("href")) == self.slug:
+            return True
+        text = normalize_name(corner.text_content())
+        return bool(self.name and text) and (self.name == text or self.name.endswith(f" {text}"))
+
+    def _bout(self, card) -> Bout:
+        bout = Bout()
+        headline = _by_class(card, "headline")
+        corners = headline[0].findall(".//a") if headline else []
+        mine = next((index for index, corner in enumerate(corners) if self._is_fighter(corner)), 0)
+        others = [corner for index, corner in enumerate(corners) if index != mine]
+        if others:
+            bout.opponent = others[0].text_content().strip() or None
+            bout.opponent_slug = _path_slug(others[0].get("href"))
+
+        # The winner's corner image carries a "win" plaque, the loser's a "loss"
+        images = _by_class(card, "red-image") + _by_class(card, "blue-image")
+        if len(images) > mine:
+            bout.result = next((RESULTS[name] for name in _classes(images[mine]) if name in RESULTS), None)
+
+        raw_date = _text(card, "date")
+        try:
+            bout.date = parse_date(raw_date) if raw_date else None
+        except (KeyError, ValueError):
+            bout.date = None
+
+        for result in _by_class(card, "result"):
+            read_result(bout, _text(result, "result-label"), _text(result, "result-text"))
+
+        for link in card.iterfind(".//a"):
+            href = link.get("href") or ""
+            if "/event/" in href:
+                bout.event_slug = _path_slug(href)
+                break
+        return bout
+
+
+def history_url(slug: str, page: int = 0) -> str:
+    """:class:`str`: The URL of one page of a fighter's listing, the athlete page itself for the first"""
+    url = athlete_url(slug)
+    return f"{url}?page={page}" if page else url
+
+
+def fetch_history_page(slug: str, page: int = 0, name: Optional[str] = None, transport: Transport = None) -> HistoryParser:
+    """:class:`HistoryParser`: Streams one page of a fighter's listing, closing the connection once it is read"""
+    parser = HistoryParser(slug, name)
+    (transport or get_transport()).stream(history_url(slug, page), parser.feed)
+    parser.close()
+    return parser
+
+
+def iter_history(slug: str, name: Optional[str] = None, transport: Transport = None, prefetch: int = 3) -> Iterator[Bout]:
+    """
+    Yields every bout of a fighter's history, most recent first, fetching pages as it goes
+
+    Once the first page shows a "Load more" link, up to ``prefetch`` pages are requested ahead
+    of the one being read, all over the same transport. Pages past the last one are cancelled,
+    or discarded when already in flight, and so are the pending ones when the caller stops iterating
+    """
+    transport = transport or get_transport()
+    prefetch = max(prefetch, 1)
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        futures = {}
+        try:
+            page = 0
+            while True:
+                # Most fighters fit on the first page, only look ahead once there is more
+                for ahead in range(page, page + (prefetch if page else 1)):
+                    if ahead not in futures:
+                        futures[ahead] = executor.submit(fetch_history_page, slug, ahead, name, transport)
+                parser = futures.pop(page).result()
+                yield from parser.bouts
+                if not parser.has_next or not parser.bouts:
+                    return
+                page += 1
+        finally:
+            for future in futures.values():
+                future.cancel()
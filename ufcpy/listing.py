@@ -0,0 +1,137 @@
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .utils import ATHLETE_URL, split_division
+
+CARD_CLASS = "athlete-listing-detail-wrp"
+NAME_CLASS = "field--name-title"
+DIVISION_CLASS = "ath-wlcass"
+RECORD_CLASS = "c-ath--record"
+
+
+def has_class(*classes: str):
+    """A class matcher for :class:`SoupStrainer` that keeps elements carrying any of ``classes``"""
+    wanted = set(classes)
+
+    def match(clas) -> bool:
+        # The strainer can see the class attribute before it is split into a list
+        if isinstance(clas, str):
+            clas = clas.split()
+        return bool(clas) and not wanted.isdisjoint(clas)
+
+    return match
+
+
+def parse_listing(content: bytes, *classes: str) -> BeautifulSoup:
+    """:class:`BeautifulSoup`: Parses only the elements of a listing page carrying one of ``classes``"""
+    return BeautifulSoup(content, "lxml", parse_only=SoupStrainer(class_=has_class(*classes)))
+
+
+class AthleteCard:
+    """The data shown on an athlete's listing card, available without loading their profile"""
+
+    __slots__ = ("name", "slug", "division", "record", "image_url")
+
+    def __init__(self, name: str, slug: str, division: Optional[str] = None, record: Optional[str] = None, image_url: Optional[str] = None):
+        self.name = name
+        self.slug = slug
+        self.division = division
+        self.record = record
+        self.image_url = image_url
+
+    def __repr__(self) -> str:
+        return f"<AthleteCard name={self.name!r} division={self.division!r}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def url(self) -> str:
+        """:class:`str`: The athlete page of the fighter"""
+        return f"{ATHLETE_URL}/{self.slug}"
+
+    @property
+    def gender(self) -> str:
+        """:class:`str`: The gender of the fighter"""
+        return split_division(self.division)[0]
+
+    @property
+    def weight_class(self) -> str:
+        """:class:`str`: The weight class of the fighter's division"""
+        return split_division(self.division)[1]
+
+    def as_dict(self) -> dict:
+        """:class:`dict`: Every field of the card keyed by name"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+def class_text(block, clas: str) -> Optional[str]:
+    """Optional[:class:`str`]: The text of the first element of ``block`` with the class ``clas``, ``None`` when missing or empty"""
+    tag = block.find(class_=clas)
+    if tag is None:
+        return None
+    return tag.get_text(" ", strip=True) or None
+
+
+def href_slug(href: Optional[str]) -> Optional[str]:
+    """
+    Optional[:class:`str`]: The athlete slug an ``href`` points at, ``None`` when it isn't an athlete link
+
+    Athlete links are relative or absolute, sometimes with a query or a fragment
+    """
+    if not href or "/athlete/" not in href:
+        return None
+    return href.split("/athlete/", 1)[1].split("?")[0].split("#")[0].strip("/") or None
+
+
+def link_slug(block) -> Optional[str]:
+    """Optional[:class:`str`]: The athlete slug of the first athlete link in ``block``"""
+    for link in block.find_all("a", href=True):
+        slug = href_slug(link["href"])
+        if slug:
+            return slug
+    return None
+
+
+def read_result(bout, label: Optional[str], text: Optional[str]) -> None:
+    """Sets a bout's round, time or method from one of the rows under it, on event cards and athlete records alike"""
+    if label == "Round":
+        bout.round = int(text) if text and text.isdigit() else None
+    elif label == "Time":
+        bout.time = text
+    elif label == "Method":
+        bout.method = text
+
+
+def parse_card(block, name_class: str = NAME_CLASS, division_class: str = DIVISION_CLASS, record_class: str = RECORD_CLASS) -> Optional[AthleteCard]:
+    """
+    Optional[:class:`AthleteCard`]: The card of a single listing block, ``None`` when it has no name
+
+    The classes default to those of the titleholder listing, other listings lay their cards out differently
+    """
+    name = class_text(block, name_class)
+    if name is None:
+        return None
+
+    slug = link_slug(block) or "-".join(name.lower().split())
+
+    record = class_text(block, record_class)
+    image = block.find("img")
+    return AthleteCard(
+        name=name,
+        slug=slug,
+        division=class_text(block, division_class),
+        record=record.split()[0] if record else None,
+        image_url=image.get("src") if image is not None else None,
+    )
+
+
+def parse_cards(parsed_url: BeautifulSoup, card_class: str = CARD_CLASS, **classes: str) -> List[AthleteCard]:
+    """:class:`List[AthleteCard]`: Every athlete card in a parsed listing, ``classes`` are passed on to :func:`parse_card`"""
+    cards = []
+    for block in parsed_url.find_all(class_=card_class):
+        card = parse_card(block, **classes)
+        if card is not None:
+            cards.append(card)
+    return cards
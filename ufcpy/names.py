@@ -0,0 +1,137 @@
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import UFCPyError
+from .listing import AthleteCard
+from .utils import athlete_slug
+
+# Letters NFKD leaves alone but people type without their stroke
+_FOLD = str.maketrans({"ø": "o", "ł": "l", "đ": "d", "ß": "ss", "æ": "ae", "œ": "oe", "ı": "i"})
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """:class:`str`: A fighter's name lowercased and stripped of accents, punctuation and suffixes like ``Jr.``"""
+    name = unicodedata.normalize("NFKD", name.lower().translate(_FOLD))
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    # Apostrophes join the name, O'Malley is typed omalley just as often as o malley
+    name = name.replace("'", "").replace("’", "")
+    return " ".join(word for word in _NON_ALNUM.sub(" ", name).split() if word not in _SUFFIXES)
+
+
+def trigrams(normalized: str) -> set:
+    """:class:`set`: The character trigrams of a normalized name, padded so short names still have some"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    def __init__(self, cards: Iterable[AthleteCard] = (), min_score: float = 0.5):
+        """
+        A local index resolving fighter names to athlete page slugs without any requests
+
+        Built from listing cards, e.g. ``NameIndex(iter_athletes())``. A name is first looked up
+        exactly after :func:`normalize_name`, then by trigram similarity for typos and partial names,
+        matches scoring below ``min_score`` are rejected
+        """
+        self.min_score = min_score
+        self._names = []
+        self._slugs = []
+        self._grams = []
+        self._exact = {}
+        self._postings = defaultdict(list)
+        self._lock = threading.Lock()
+        for card in cards:
+            self.add(card.name, card.slug)
+
+    def __repr__(self) -> str:
+        return f"<NameIndex names={len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._exact
+
+    def add(self, name: str, slug: str) -> None:
+        """Indexes ``name``, and the words of ``slug``, as names of the fighter at ``slug``, e.g. a nickname"""
+        with self._lock:
+            for alias in (normalize_name(name), normalize_name(slug.replace("-", " "))):
+                entries = self._exact.setdefault(alias, []) if alias else None
+                if entries is None or any(self._slugs[entry] == slug for entry in entries):
+                    continue
+                entry = len(self._names)
+                entries.append(entry)
+                self._names.append(name)
+                self._slugs.append(slug)
+                grams = trigrams(alias)
+                self._grams.append(len(grams))
+                for gram in grams:
+                    self._postings[gram].append(entry)
+
+    def search(self, name: str, limit: int = 5) -> List[Tuple[str, str, float]]:
+        """
+        :class:`List[Tuple[str, str, float]]`: The closest fighters to ``name`` as ``(slug, name, score)``, best first
+
+        The score is the Dice coefficient of the trigrams, 1.0 for an exact normalized match
+        """
+        normalized = normalize_name(name)
+        grams = trigrams(normalized)
+        shared = defaultdict(int)
+        for gram in grams:
+            for entry in self._postings.get(gram, ()):
+                shared[entry] += 1
+
+        best: Dict[str, Tuple[str, str, float]] = {}
+        for entry in self._exact.get(normalized, ()):
+            best[self._slugs[entry]] = (self._slugs[entry], self._names[entry], 1.0)
+        for entry, count in shared.items():
+            slug = self._slugs[entry]
+            score = 2.0 * count / (len(grams) + self._grams[entry])
+            if slug not in best or best[slug][2] < score:
+                best[slug] = (slug, self._names[entry], score)
+        return sorted(best.values(), key=lambda match: -match[2])[:limit]
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Optional[:class:`str`]: The slug of the fighter best matching ``name``, ``None`` when nothing is close"""
+        exact = self._exact.get(normalize_name(name))
+        if exact:
+            return self._slugs[exact[0]]
+        matches = self.search(name, limit=1)
+        if matches and matches[0][2] >= self.min_score:
+            return matches[0][0]
+        return None
+
+
+_name_index = None
+
+
+def get_name_index() -> Optional[NameIndex]:
+    """Optional[:class:`NameIndex`]: The index used by :func:`find_fighter_by_fullname`, ``None`` when unset"""
+    return _name_index
+
+
+def set_name_index(index: Optional[NameIndex]) -> None:
+    """Sets the index used to resolve names to slugs, ``None`` goes back to guessing the slug from the name"""
+    global _name_index
+    _name_index = index
+
+
+def resolve_slug(name: str) -> str:
+    """
+    :class:`str`: The athlete page slug of a fighter's name, through the name index when one is set
+
+    Without an index the slug is guessed from the name. With one, a name it can't match raises
+    :class:`UFCPyError` before any request is made
+    """
+    index = _name_index
+    if index is None:
+        return athlete_slug(name)
+    slug = index.resolve(name)
+    if slug is None:
+        raise UFCPyError(f"No fighter on the roster matches {name!r}")
+    return slug
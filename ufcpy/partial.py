@@ -0,0 +1,134 @@
+from typing import Dict, Iterable, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
+
+from .stats import BIO_SELECTOR, Extractor, _extractor
+
+# Class prefixes of the athlete page sections the extractor reads, everything else is skipped
+SECTION_PREFIXES = ("hero-profile", "c-bio", "c-stat-", "c-overlap", "e-chart-circle")
+ID_PREFIXES = ("e-stat-body",)
+# Tags the sections are built from on top of the ones the extractor reads
+SECTION_TAGS = {"div", "dl", "svg", "g"}
+# Containers of the rest of the page, they raise events only so they can be dropped whole once closed
+SKIPPED_TAGS = {"nav", "header", "footer", "aside", "section", "article", "form", "table"}
+
+# The element classes of lxml.html.document_fromstring for the pull parsers, looked up in C
+HTML_CLASS_LOOKUP = etree.ElementDefaultClassLookup(
+    element=lxml.html.HtmlElement, comment=lxml.html.HtmlComment, pi=lxml.html.HtmlProcessingInstruction, entity=lxml.html.HtmlEntity
+)
+
+
+def is_section(classes: Iterable[str], id: Optional[str] = None) -> bool:
+    """:class:`bool`: Whether an element with these classes and id belongs to a section the extractor reads"""
+    if id and id.startswith(ID_PREFIXES):
+        return True
+    return any(clas.startswith(SECTION_PREFIXES) for clas in classes)
+
+
+def _section_class(clas) -> bool:
+    # The strainer can see the class attribute before it is split into a list
+    if isinstance(clas, str):
+        clas = clas.split()
+    return bool(clas) and is_section(clas)
+
+
+class SectionParser:
+    def __init__(self, extractor: Extractor = _extractor):
+        """
+        An incremental athlete page parser that only keeps the sections the extractor reads
+
+        Feed it the page in chunks, elements outside the hero, bio and stat sections are
+        dropped from the tree as soon as they close, and :attr:`done` turns true once every field the
+        extractor needs has been seen so the rest of the page can be skipped
+        """
+        self._extractor = extractor
+        # Only tags that can hold a field or enclose a skipped part of the page raise events,
+        # the rest of the page is handled in C
+        self._parser = etree.HTMLPullParser(events=("start", "end"), tag=self._event_tags(extractor))
+        # Same element classes as lxml.html.document_fromstring, so the extractor reads both alike,
+        # looked up in C rather than through HtmlElementClassLookup's Python callback per element
+        self._parser.set_element_class_lookup(HTML_CLASS_LOOKUP)
+        self._needed = self._needed_matches(extractor)
+        self._seen = dict.fromkeys(self._needed, 0)
+        self._missing = len(self._needed)
+        self._section_depth = 0
+        self._sections_closed = 0
+        self._stack = []
+        self.bytes_fed = 0
+        self.done = False
+
+    @staticmethod
+    def _event_tags(extractor: Extractor) -> tuple:
+        return tuple(sorted(set(extractor._tags) | SECTION_TAGS | SKIPPED_TAGS))
+
+    @staticmethod
+    def _needed_matches(extractor: Extractor) -> Dict[str, int]:
+        needed = {BIO_SELECTOR: 1}
+        for spec in extractor.fields:
+            if spec.selector:
+                needed[spec.selector] = max(needed.get(spec.selector, 0), spec.index + 1)
+        return needed
+
+    def _matched(self, element) -> None:
+        found = {}
+        classes = element.get("class")
+        self._extractor._bucket(element, element.tag, classes.split() if classes else (), element.get("id"), found)
+        for selector in found:
+            if selector in self._seen:
+                self._seen[selector] += 1
+                if self._seen[selector] == self._needed[selector]:
+                    self._missing -= 1
+
+    def feed(self, chunk: bytes) -> bool:
+        """:class:`bool`: Parses the next chunk of the page and returns whether the rest can be skipped"""
+        if self.done:
+            return True
+        self.bytes_fed += len(chunk)
+        self._parser.feed(chunk)
+        stack = self._stack
+        for event, element in self._parser.read_events():
+            if event == "start":
+                # Remember how many sections had closed so the end event knows if this element holds one
+                stack.append(self._sections_closed)
+                if self._section_depth:
+                    self._section_depth += 1
+                elif element.attrib and is_section((element.get("class") or "").split(), element.get("id")):
+                    self._section_depth = 1
+                continue
+
+            closed_before = stack.pop() if stack else self._sections_closed
+            if self._section_depth:
+                self._section_depth -= 1
+                if self._section_depth == 0:
+                    self._sections_closed += 1
+                if element.attrib:
+                    self._matched(element)
+            elif closed_before == self._sections_closed:
+                # Nothing in it is read, drop it from the tree rather than keep an empty shell
+                parent = element.getparent()
+                if parent is not None:
+                    parent.remove(element)
+                else:
+                    element.clear()
+            if self._missing == 0:
+                self.done = True
+                break
+        return self.done
+
+    def close(self):
+        """The root of the trimmed page, ready for :func:`extract_stats`"""
+        return self._parser.close()
+
+
+def parse_sections(content: bytes, backend: str = "lxml"):
+    """
+    Parses an athlete page that is already in memory for the sections the extractor reads
+
+    With lxml the whole page is parsed in one go, faster than feeding it through :class:`SectionParser`,
+    which only pays off on a download it can cut short. With bs4 a :class:`SoupStrainer` keeps only the section subtrees
+    """
+    if backend == "bs4":
+        return BeautifulSoup(content, "lxml", parse_only=SoupStrainer(class_=_section_class))
+    return lxml.html.document_fromstring(content)
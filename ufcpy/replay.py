@@ -0,0 +1,187 @@
+"""
+Record and replay HTTP traffic for deterministic, network-free runs
+
+:class:`RecordingTransport` saves every response it fetches, redirect history included, to a
+zip archive and :class:`ReplayTransport` serves them back from it. Both can be passed anywhere
+a :class:`Transport` is accepted, e.g. ``find_fighter_by_fullname(name, transport=replay)``.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+import zipfile
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import UFCPyError
+from .transport import Transport, get_transport
+from .utils import check_response
+
+INDEX = "index.json"
+# Headers worth keeping, the rest only inflate the archive
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Location")
+
+
+def _headers(res: requests.Response) -> Dict[str, str]:
+    return {name: res.headers[name] for name in KEPT_HEADERS if name in res.headers}
+
+
+def _response(url: str, status: int, headers: dict, body: bytes, history: List[requests.Response] = ()) -> requests.Response:
+    res = requests.Response()
+    res.status_code = status
+    res.url = url
+    res.headers = CaseInsensitiveDict(headers)
+    res._content = body
+    res.encoding = "utf-8"
+    res.history = list(history)
+    return res
+
+
+class RecordingTransport:
+    def __init__(self, path: str, transport: Optional[Transport] = None):
+        """
+        Fetches through ``transport``, the default one if not given, and records every response to ``path``
+
+        The archive is written on :meth:`save` and when used as a context manager. Identical
+        bodies are stored once and pages are always fetched in full, so they can be replayed
+        through streaming lookups too
+        """
+        self.path = path
+        self.transport = transport
+        self._entries = {}
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def urls(self) -> List[str]:
+        """:class:`List[str]`: Every URL recorded so far"""
+        return list(self._entries)
+
+    def get(self, url: str) -> requests.Response:
+        """:class:`requests.Response`: Fetches ``url`` and records the response"""
+        res = (self.transport or get_transport()).get(url)
+        body = res.content
+        member = hashlib.sha1(body).hexdigest()
+        entry = {
+            "url": res.url,
+            "status": res.status_code,
+            "headers": _headers(res),
+            "body": member,
+            "history": [
+                {"url": hop.url, "status": hop.status_code, "headers": _headers(hop)} for hop in res.history
+            ],
+        }
+        with self._lock:
+            self._bodies[member] = body
+            self._entries[url] = entry
+        return res
+
+    def stream(self, url: str, consume: Callable[[bytes], bool], consume_whole: Optional[Callable[[bytes], Any]] = None, **kwargs) -> requests.Response:
+        """:class:`requests.Response`: Fetches and records the whole page, then hands it to ``consume_whole``, or ``consume`` without one"""
+        res = self.get(url)
+        check_response(res)
+        (consume_whole or consume)(res.content)
+        return res
+
+    def save(self) -> None:
+        """Writes every recorded response to the archive, replacing it"""
+        with self._lock:
+            with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(INDEX, json.dumps(self._entries, sort_keys=True))
+                for member, body in self._bodies.items():
+                    archive.writestr(member, body)
+
+    def close(self) -> None:
+        """Saves the archive"""
+        self.save()
+
+
+class ReplayTransport:
+    def __init__(
+        self,
+        path: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        concurrency: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Serves the responses of an archive written by :class:`RecordingTransport`, without any network
+
+        Each response takes ``latency`` seconds plus up to ``jitter`` more, and at most
+        ``concurrency`` of them are in flight at once, like a server with that many connections.
+        ``seed`` makes the jitter reproducible. A URL that was never recorded raises :class:`UFCPyError`
+        """
+        self.path = path
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._slots = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self._archive = zipfile.ZipFile(path, "r")
+        self._entries = json.loads(self._archive.read(INDEX))
+        self._bodies = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ReplayTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def urls(self) -> List[str]:
+        """:class:`List[str]`: Every URL in the archive"""
+        return list(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def _body(self, member: str) -> bytes:
+        body = self._bodies.get(member)
+        if body is None:
+            body = self._bodies[member] = self._archive.read(member)
+        return body
+
+    def _wait(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+    def get(self, url: str) -> requests.Response:
+        """:class:`requests.Response`: The recorded response for ``url``, redirect history included"""
+        entry = self._entries.get(url)
+        if entry is None:
+            raise UFCPyError(f"{url} was not recorded in {self.path}")
+        if self._slots is not None:
+            with self._slots:
+                self._wait()
+        else:
+            self._wait()
+        with self._lock:
+            self.requests += 1
+        history = [_response(hop["url"], hop["status"], hop["headers"], b"") for hop in entry["history"]]
+        return _response(entry["url"], entry["status"], entry["headers"], self._body(entry["body"]), history)
+
+    def stream(self, url: str, consume: Callable[[bytes], bool], consume_whole: Optional[Callable[[bytes], Any]] = None, **kwargs) -> requests.Response:
+        """:class:`requests.Response`: The recorded response for ``url``, handed whole to ``consume_whole``, or ``consume`` without one"""
+        res = self.get(url)
+        check_response(res)
+        (consume_whole or consume)(res.content)
+        return res
+
+    def close(self) -> None:
+        """Closes the archive"""
+        self._archive.close()
@@ -0,0 +1,127 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlencode
+
+from .Fighter import LookupResult, find_fighter_by_slug
+from .core import fetch
+from .listing import AthleteCard, parse_cards, parse_listing
+from .transport import Transport
+
+ROSTER_URL = "https://ufc.com/athletes/all"
+PAGER_CLASS = "pager"
+
+# The directory renders flip cards, not the titleholder listing's cards
+CARD_CLASS = "c-listing-athlete-flipcard"
+NAME_CLASS = "c-listing-athlete__name"
+DIVISION_CLASS = "c-listing-athlete__title"
+RECORD_CLASS = "c-listing-athlete__record"
+
+
+def roster_url(page: int = 0, filters: Iterable[str] = ()) -> str:
+    """:class:`str`: The URL of a page of the athlete directory, ``filters`` are ufc.com facets like ``weight_class:Lightweight``"""
+    query = [(f"filters[{i}]", value) for i, value in enumerate(filters)]
+    if page:
+        query.append(("page", page))
+    return f"{ROSTER_URL}?{urlencode(query)}" if query else ROSTER_URL
+
+
+class RosterPage:
+    """A single page of the athlete directory"""
+
+    __slots__ = ("number", "cards", "has_next")
+
+    def __init__(self, number: int, cards: list, has_next: bool):
+        self.number = number
+        self.cards = cards
+        self.has_next = has_next
+
+    def __repr__(self) -> str:
+        return f"<RosterPage number={self.number} cards={len(self.cards)}>"
+
+
+def fetch_page(page: int = 0, filters: Iterable[str] = (), transport: Transport = None) -> RosterPage:
+    """:class:`RosterPage`: Downloads one page of the athlete directory and parses only its cards and pager"""
+    parsed_url = parse_listing(fetch(roster_url(page, filters), transport=transport), CARD_CLASS, PAGER_CLASS)
+    has_next = any(
+        link.get("rel") and "next" in link.get("rel")
+        for link in parsed_url.select(f".{PAGER_CLASS} a")
+    )
+    cards = parse_cards(parsed_url, CARD_CLASS, name_class=NAME_CLASS, division_class=DIVISION_CLASS, record_class=RECORD_CLASS)
+    return RosterPage(page, cards, has_next)
+
+
+def iter_pages(*filters: str, prefetch: int = 2, start: int = 0, max_pages: Optional[int] = None, transport: Transport = None) -> Iterator[RosterPage]:
+    """
+    Walks the athlete directory page by page
+
+    Up to ``prefetch`` of the following pages are downloaded while the current one is consumed,
+    so at most ``prefetch + 1`` pages are held in memory at once
+    """
+    last = None if max_pages is None else start + max_pages
+    with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as executor:
+        pending = deque()
+        number = start
+
+        def schedule():
+            nonlocal number
+            while len(pending) <= prefetch and (last is None or number < last):
+                pending.append(executor.submit(fetch_page, number, filters, transport))
+                number += 1
+
+        try:
+            schedule()
+            while pending:
+                page = pending.popleft().result()
+                if not page.cards:
+                    return
+                yield page
+                if not page.has_next:
+                    return
+                schedule()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iter_athletes(*filters: str, prefetch: int = 2, max_pages: Optional[int] = None, transport: Transport = None) -> Iterator[AthleteCard]:
+    """
+    Streams the listing card of every athlete in the directory as each page arrives
+
+    ``filters`` are ufc.com facets like ``weight_class:Lightweight``. Only the cards are parsed,
+    profiles can be loaded afterwards with :func:`hydrate`
+    """
+    for page in iter_pages(*filters, prefetch=prefetch, max_pages=max_pages, transport=transport):
+        yield from page.cards
+
+
+def hydrate(cards: Iterable[AthleteCard], max_workers: int = 8, compact: bool = True, transport: Transport = None, use_cache: bool = False, backend: str = "lxml", partial: bool = True) -> Iterator[LookupResult]:
+    """
+    Loads the full profile of every card, as a pipeline stage over :func:`iter_athletes`
+
+    Results are yielded in input order with at most ``max_workers * 2`` profiles in flight.
+    Profiles are compact, parsed with lxml directly down to their stat sections only and skip the
+    fighter cache by default so a full crawl stays fast and bounded in memory
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for index, card in enumerate(cards):
+                future = executor.submit(
+                    find_fighter_by_slug, card.slug, compact=compact, transport=transport, use_cache=use_cache, backend=backend, partial=partial
+                )
+                pending.append((index, card, future))
+                if len(pending) >= max_workers * 2:
+                    yield _result(*pending.popleft())
+            while pending:
+                yield _result(*pending.popleft())
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+
+def _result(index: int, card: AthleteCard, future) -> LookupResult:
+    try:
+        return LookupResult(card.name, index, fighter=future.result())
+    except Exception as error:
+        return LookupResult(card.name, index, error=error)
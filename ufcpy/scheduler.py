@@ -0,0 +1,344 @@
+"""
+Adaptive request scheduling, so parallel lookups run as fast as ufc.com allows without getting blocked
+
+Every request a :class:`Transport` sends waits its turn in a per-host queue of the shared
+:class:`Scheduler`. Each host has an optional token bucket capping its requests per second and
+a concurrency limit that adapts AIMD style: it grows by one request per window of healthy
+responses and is cut back when latency climbs or the host answers 429 or 503, in which case the
+host is also paused for its ``Retry-After``.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# Statuses telling us to slow down, they are retried after the host's pause
+THROTTLED_STATUSES = (429, 503)
+
+
+def retry_after(res: requests.Response) -> Optional[float]:
+    """Optional[:class:`float`]: The seconds a response's ``Retry-After`` header asks to wait, ``None`` without one"""
+    value = res.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Allows ``rate`` requests per second on average and bursts of up to ``burst``, ``rate`` by default
+
+        Not thread safe on its own, :class:`HostQueue` only touches it under its lock
+        """
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def take(self, now: float) -> float:
+        """:class:`float`: Takes a token and returns 0, or returns the seconds until one is available"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+
+class HostQueue:
+    def __init__(
+        self,
+        host: str,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        latency_tolerance: float = 2.0,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        hold: float = 30.0,
+    ):
+        """
+        The queue, rate limit and adaptive concurrency limit of a single host
+
+        Requests are admitted first in, first out. Once the recent latency gets ``latency_tolerance``
+        times the long-run average, the limit is cut by a quarter, at most once per round trip.
+        A throttled response halves it and pauses the host for its ``Retry-After``, or ``backoff``
+        doubled for each throttled response in a row, up to ``max_backoff``. For ``hold`` seconds
+        after that the limit stays below the one that got throttled instead of probing into it again
+        """
+        self.host = host
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.limit = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_tolerance = latency_tolerance
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hold = hold
+        self.active = 0
+        self.requests = 0
+        self.throttled = 0
+        self.paused_until = 0.0
+        self.latency = None
+        self.baseline = None
+        self._throttled_in_row = 0
+        self._last_decrease = 0.0
+        self._ceiling = 0.0
+        self._hold_until = 0.0
+        self._queue = deque()
+        self._cond = threading.Condition()
+        # Futures of the coroutines waiting in acquire_async, each woken on its own event loop
+        self._waiters = set()
+
+    def __repr__(self) -> str:
+        return f"<HostQueue host={self.host!r} limit={int(self.limit)} active={self.active} queued={len(self._queue)}>"
+
+    def _admit(self, ticket: object) -> Optional[float]:
+        # 0 once ``ticket`` may go, the seconds to wait before trying again, or None to wait for a notify
+        now = time.monotonic()
+        if self._queue[0] is not ticket or self.active >= int(self.limit):
+            return None
+        if now < self.paused_until:
+            return self.paused_until - now
+        return self.bucket.take(now) if self.bucket is not None else 0.0
+
+    def _notify(self) -> None:
+        # Whoever is next in line may be able to go now, called under the lock
+        self._cond.notify_all()
+        for future in self._waiters:
+            loop = future.get_loop()
+            if not future.done() and not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+    def acquire(self) -> None:
+        """Waits until this request is first in line, under the concurrency limit, unpaused and has a token"""
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+            try:
+                while True:
+                    wait = self._admit(ticket)
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(wait)
+            finally:
+                self._queue.remove(ticket)
+                self._notify()
+            self.active += 1
+
+    async def acquire_async(self) -> None:
+        """Like :meth:`acquire`, waiting on the running event loop instead of blocking it"""
+        loop = asyncio.get_running_loop()
+        ticket = object()
+        with self._cond:
+            self._queue.append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._admit(ticket)
+                    if wait == 0.0:
+                        self.active += 1
+                        return
+                    future = loop.create_future()
+                    self._waiters.add(future)
+                try:
+                    await asyncio.wait_for(future, wait)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    with self._cond:
+                        self._waiters.discard(future)
+        finally:
+            with self._cond:
+                self._queue.remove(ticket)
+                self._notify()
+
+    def release(self, start: float, status: Optional[int] = None, wait: Optional[float] = None) -> None:
+        """
+        Frees the slot of a request sent at ``start`` and adapts the limit to how it went
+
+        ``status`` is ``None`` when the request failed, ``wait`` is the ``Retry-After`` of a throttled response
+        """
+        with self._cond:
+            self.active -= 1
+            self.requests += 1
+            now = time.monotonic()
+            latency = now - start
+            if status in THROTTLED_STATUSES:
+                self.throttled += 1
+                self._throttled_in_row += 1
+                if wait is None:
+                    wait = min(self.backoff * 2 ** (self._throttled_in_row - 1), self.max_backoff)
+                self.paused_until = max(self.paused_until, now + wait)
+                ceiling = self.limit
+                if self._decrease(start, 0.5):
+                    self._ceiling = ceiling
+                    self._hold_until = now + self.hold
+            elif status is not None:
+                self._throttled_in_row = 0
+                self._observe(start, latency)
+            self._notify()
+
+    def _observe(self, start: float, latency: float) -> None:
+        # A short average of the latency against a long one, the long one only catches up with
+        # a lasting slowdown after a few hundred responses, by then the limit has been cut for it
+        if self.latency is None:
+            self.latency = self.baseline = latency
+        self.latency += (latency - self.latency) * 0.2
+        self.baseline += (latency - self.baseline) * 0.01
+        if self.latency > self.baseline * self.latency_tolerance:
+            self._decrease(start, 0.75)
+        elif self.active + 1 >= int(self.limit):
+            # Additive increase, one more request in flight per window of healthy responses while the
+            # limit is what holds requests back. For a while after being throttled, stay under that limit
+            ceiling = float(self.max_concurrency)
+            if start < self._hold_until:
+                ceiling = min(ceiling, max(self._ceiling - 1.0, float(self.min_concurrency)))
+            if self.limit < ceiling:
+                self.limit = min(self.limit + 1.0 / self.limit, ceiling)
+
+    def _decrease(self, start: float, factor: float) -> bool:
+        # Requests sent before the last cut reflect the old limit, only the ones sent since count
+        if start < self._last_decrease:
+            return False
+        self._last_decrease = time.monotonic()
+        self.limit = max(self.limit * factor, float(self.min_concurrency))
+        return True
+
+    @property
+    def info(self) -> dict:
+        """:class:`dict`: The current limit, load and counters of the host"""
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "active": self.active,
+                "queued": len(self._queue),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "latency": self.latency,
+                "paused": max(self.paused_until - time.monotonic(), 0.0),
+            }
+
+
+class Scheduler:
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        latency_tolerance: float = 2.0,
+        retries: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        hold: float = 30.0,
+    ):
+        """
+        Schedules requests over one :class:`HostQueue` per host
+
+        ``rate`` caps each host's requests per second, unlimited when ``None``, ``burst`` is how
+        many can go at once after a quiet spell. Concurrency starts at ``concurrency`` and adapts
+        between ``min_concurrency`` and ``max_concurrency``. A throttled response is retried up to
+        ``retries`` times once its host's pause is over, the last one is returned as is.
+        The other options are those of :class:`HostQueue`
+        """
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_tolerance = latency_tolerance
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hold = hold
+        self._hosts: Dict[str, HostQueue] = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> HostQueue:
+        """:class:`HostQueue`: The queue of the host ``url`` points at"""
+        host = urlsplit(url).netloc.lower()
+        queue = self._hosts.get(host)
+        if queue is None:
+            with self._lock:
+                queue = self._hosts.get(host)
+                if queue is None:
+                    queue = self._hosts[host] = HostQueue(
+                        host,
+                        rate=self.rate,
+                        burst=self.burst,
+                        concurrency=self.concurrency,
+                        min_concurrency=self.min_concurrency,
+                        max_concurrency=self.max_concurrency,
+                        latency_tolerance=self.latency_tolerance,
+                        backoff=self.backoff,
+                        max_backoff=self.max_backoff,
+                        hold=self.hold,
+                    )
+        return queue
+
+    def request(self, url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        :class:`requests.Response`: Calls ``send`` once ``url``'s host admits it, retrying throttled responses
+
+        The slot is held until ``send`` returns, for a streamed response that is once the headers are in
+        """
+        queue = self.host(url)
+        for attempt in range(self.retries + 1):
+            queue.acquire()
+            start = time.monotonic()
+            try:
+                res = send()
+            except Exception:
+                queue.release(start)
+                raise
+            queue.release(start, res.status_code, retry_after(res))
+            if res.status_code not in THROTTLED_STATUSES or attempt == self.retries:
+                return res
+            res.close()
+
+    @property
+    def info(self) -> Dict[str, dict]:
+        """:class:`Dict[str, dict]`: The :attr:`HostQueue.info` of every host seen so far"""
+        return {host: queue.info for host, queue in list(self._hosts.items())}
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> Scheduler:
+    """:class:`Scheduler`: The scheduler shared by every transport created without one"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = Scheduler()
+    return _scheduler
+
+
+def set_scheduler(scheduler: Optional[Scheduler]) -> None:
+    """Replaces the shared scheduler, ``None`` restores a fresh default on next use"""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
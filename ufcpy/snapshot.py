@@ -0,0 +1,292 @@
+"""
+A compact, memory-mapped snapshot of the roster for starting up without the network
+
+The file holds one fixed-width column per field plus the slug of each fighter's athlete page,
+a table of every distinct string and an index of fighters sorted by that slug. Loading it maps
+the file read-only, so it is near instant and every process serving the same snapshot shares its pages.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .Fighter import Fighter
+from .exceptions import UFCPyError
+from .export import COLUMN_TYPES, StatsTable
+from .names import normalize_name
+from .stats import FighterStats
+from .utils import athlete_slug
+
+MAGIC = b"UFCPYSNP"
+VERSION = 2
+# Stored next to the stat columns, it isn't a field of the record
+SLUG_COLUMN = "slug"
+
+# magic, version, byte order, rows, then the offset and length of the schema, strings and index
+_HEADER = struct.Struct("<8sHHIQQQQQQ")
+_BYTE_ORDERS = {"little": 1, "big": 2}
+
+# Typecode of each column kind and the value standing in for a missing one
+_TYPECODES = {"int64": "q", "float64": "d", "date": "i", "string": "I"}
+_INT_NULL = -(2 ** 63)
+_DATE_NULL = 0
+_STRING_NULL = 0xFFFFFFFF
+
+
+def _align(fh, size: int = 8) -> int:
+    position = fh.tell()
+    padding = -position % size
+    fh.write(b"\0" * padding)
+    return position + padding
+
+
+class _StringTable:
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, value: str) -> Tuple[int, int]:
+        encoded = value.encode("utf-8")
+        offset = self.offsets.get(encoded)
+        if offset is None:
+            offset = self.offsets[encoded] = len(self.data)
+            self.data += encoded
+        return offset, len(encoded)
+
+
+def _column(kind: str, values: Iterable, strings: _StringTable) -> array:
+    if kind == "int64":
+        return array("q", (_INT_NULL if value is None else value for value in values))
+    if kind == "float64":
+        return array("d", (float("nan") if value is None else value for value in values))
+    if kind == "date":
+        return array("i", (_DATE_NULL if value is None else value.toordinal() for value in values))
+    column = array("I")
+    for value in values:
+        column.extend((_STRING_NULL, 0) if value is None else strings.add(value))
+    return column
+
+
+def write_snapshot(path: str, fighters: Iterable) -> int:
+    """
+    :class:`int`: Writes the stats of many fighters to a snapshot file and returns how many were written
+
+    ``fighters`` is a :class:`StatsTable` or anything it accepts. The file is replaced atomically.
+    Fighters are indexed by the slug of their athlete page, guessed from the name only for a bare
+    :class:`FighterStats` record. The first of any duplicate wins.
+    """
+    table = fighters if isinstance(fighters, StatsTable) else StatsTable(fighters)
+    names = table["name"] if "name" in table.columns else (None,) * len(table)
+    slugs = [slug or (athlete_slug(name) if name else None) for slug, name in zip(table.slugs, names)]
+    strings = _StringTable()
+    schema = []
+    columns = []
+    for name in table.columns:
+        kind = COLUMN_TYPES[name]
+        schema.append({"name": name, "kind": kind})
+        columns.append(_column(kind, table[name], strings))
+    schema.append({"name": SLUG_COLUMN, "kind": "string"})
+    columns.append(_column("string", slugs, strings))
+
+    keys = {}
+    for row, slug in enumerate(slugs):
+        if slug:
+            keys.setdefault(slug.encode("utf-8"), row)
+    index = array("I")
+    for key in sorted(keys):
+        index.extend((*strings.add(key.decode("utf-8")), keys[key]))
+
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as fh:
+        fh.write(b"\0" * _HEADER.size)
+        for entry, column in zip(schema, columns):
+            entry["offset"] = _align(fh)
+            column.tofile(fh)
+        schema_bytes = json.dumps(schema).encode("utf-8")
+        schema_offset = _align(fh)
+        fh.write(schema_bytes)
+        strings_offset = _align(fh)
+        fh.write(strings.data)
+        index_offset = _align(fh)
+        index.tofile(fh)
+        fh.seek(0)
+        fh.write(_HEADER.pack(
+            MAGIC, VERSION, _BYTE_ORDERS[sys.byteorder], len(table),
+            schema_offset, len(schema_bytes), strings_offset, len(strings.data), index_offset, len(keys),
+        ))
+    os.replace(temp, path)
+    return len(table)
+
+
+class SnapshotStats:
+    """A :class:`FighterStats` look-alike whose fields are read from the snapshot when accessed"""
+
+    __slots__ = ("_snapshot", "_row")
+
+    def __init__(self, snapshot: "Snapshot", row: int):
+        self._snapshot = snapshot
+        self._row = row
+
+    def __getattr__(self, field: str):
+        if field not in FighterStats.__slots__:
+            raise AttributeError(field)
+        return self._snapshot.value(field, self._row)
+
+    def __repr__(self) -> str:
+        return f"<SnapshotStats name={self.name!r}>"
+
+    def as_dict(self) -> dict:
+        """:class:`dict`: Every field of the record keyed by name"""
+        return {field: getattr(self, field) for field in FighterStats.__slots__}
+
+    def to_stats(self) -> FighterStats:
+        """:class:`FighterStats`: A copy of the record that no longer needs the snapshot"""
+        return FighterStats(**self.as_dict())
+
+
+class SnapshotFighter(Fighter):
+    def __init__(self, snapshot: "Snapshot", row: int):
+        """A fighter served from a :class:`Snapshot`, each field is read from the mapped file on access"""
+        super().__init__(None, slug=snapshot.value(SLUG_COLUMN, row))
+        self._record = SnapshotStats(snapshot, row)
+
+    def __repr__(self) -> str:
+        return f"<SnapshotFighter name={self.name!r}>"
+
+
+class Snapshot:
+    def __init__(self, path: str):
+        """
+        A roster snapshot written by :func:`write_snapshot`, memory-mapped read-only
+
+        Fighters are looked up by name or slug with a binary search over the index and
+        their fields are decoded one at a time, only when read
+        """
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load()
+        except Exception:
+            self.close()
+            raise
+
+    def _load(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise UFCPyError(f"{self.path} is not a ufcpy snapshot")
+        (
+            magic, version, byte_order, rows, schema_offset, schema_length,
+            strings_offset, strings_length, index_offset, index_length,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise UFCPyError(f"{self.path} is not a version {VERSION} ufcpy snapshot")
+        if byte_order != _BYTE_ORDERS[sys.byteorder]:
+            raise UFCPyError(f"{self.path} was written on a machine with a different byte order")
+
+        self._rows = rows
+        view = self._view = memoryview(self._mmap)
+        self._strings = view[strings_offset:strings_offset + strings_length]
+        self._columns = {}
+        for entry in json.loads(bytes(view[schema_offset:schema_offset + schema_length])):
+            typecode = _TYPECODES[entry["kind"]]
+            width = array(typecode).itemsize * (2 if entry["kind"] == "string" else 1)
+            start = entry["offset"]
+            self._columns[entry["name"]] = (entry["kind"], view[start:start + width * rows].cast(typecode))
+        self._index = view[index_offset:index_offset + 12 * index_length].cast("I")
+        self._index_length = index_length
+
+    def close(self) -> None:
+        """Releases the mapped file, fighters served from it can no longer be read"""
+        # Every view onto the map has to be released before it can be closed
+        views = [values for _, values in getattr(self, "_columns", {}).values()]
+        views += [getattr(self, name, None) for name in ("_strings", "_index", "_view")]
+        for view in views:
+            if view is not None:
+                view.release()
+        self._columns = {}
+        self._strings = self._index = self._view = None
+        self._mmap.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Snapshot path={self.path!r} fighters={self._rows}>"
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __iter__(self) -> Iterator[SnapshotFighter]:
+        return (SnapshotFighter(self, row) for row in range(self._rows))
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    @property
+    def columns(self) -> List[str]:
+        """:class:`List[str]`: The fields stored in the snapshot"""
+        return [name for name in self._columns if name != SLUG_COLUMN]
+
+    def _string(self, offset: int, length: int) -> str:
+        return str(self._strings[offset:offset + length], "utf-8")
+
+    def value(self, field: str, row: int):
+        """The value of a field for the fighter at ``row``, ``None`` when missing or not in the snapshot"""
+        if self._view is None:
+            raise UFCPyError(f"{self.path} has been closed, its fighters can no longer be read")
+        column = self._columns.get(field)
+        if column is None:
+            return None
+        kind, values = column
+        if kind == "string":
+            offset = values[2 * row]
+            return None if offset == _STRING_NULL else self._string(offset, values[2 * row + 1])
+        value = values[row]
+        if kind == "int64":
+            return None if value == _INT_NULL else value
+        if kind == "float64":
+            return None if value != value else value
+        return None if value == _DATE_NULL else date.fromordinal(value)
+
+    def _find(self, name: str) -> Optional[int]:
+        # A slug as is, then the slug of the name, then of the name without its accents and punctuation
+        tried = set()
+        for key in (name, athlete_slug(name), "-".join(normalize_name(name).split())):
+            if key and key not in tried:
+                tried.add(key)
+                row = self._search(key.encode("utf-8"))
+                if row is not None:
+                    return row
+        return None
+
+    def _search(self, key: bytes) -> Optional[int]:
+        index = self._index
+        low, high = 0, self._index_length
+        while low < high:
+            middle = (low + high) // 2
+            offset, length = index[3 * middle], index[3 * middle + 1]
+            candidate = self._strings[offset:offset + length]
+            if candidate == key:
+                return index[3 * middle + 2]
+            if bytes(candidate) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get(self, name: str) -> Optional[SnapshotFighter]:
+        """Optional[:class:`SnapshotFighter`]: A fighter by full name or slug, ``None`` when not in the snapshot"""
+        row = self._find(name)
+        return None if row is None else SnapshotFighter(self, row)
+
+    def slugs(self) -> List[str]:
+        """:class:`List[str]`: The slug of every indexed fighter, sorted"""
+        index = self._index
+        return [self._string(index[3 * entry], index[3 * entry + 1]) for entry in range(self._index_length)]
@@ -0,0 +1,304 @@
+from datetime import date
+from typing import Callable, Dict, Optional, Sequence
+
+# Month names are abbreviated AP style on the site, e.g. "Aug." or "Sept.", the first three letters are enough
+_MONTHS = {name: number for number, name in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+)}
+
+def _strip(value: str) -> str:
+    return value.strip()
+
+
+def _first_word(value: str) -> str:
+    return value.split()[0].strip()
+
+
+def _percent(value: str) -> str:
+    return value.strip().strip("%")
+
+
+def _bar_count(value: str) -> str:
+    return value.split(" ")[0]
+
+
+def _bar_percent(value: str) -> str:
+    return value.split(" ")[1].strip("(%)")
+
+
+def _nickname(value: str) -> str:
+    return value.strip('/"')
+
+
+def _seconds(value: str) -> int:
+    # "15:04" is minutes and seconds, "1:02:10" would carry hours
+    seconds = 0
+    for part in value.strip().split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+def _feet(value: str) -> int:
+    return divmod(round(float(value)), 12)[0]
+
+
+def _inches(value: str) -> int:
+    return divmod(round(float(value)), 12)[1]
+
+
+def parse_date(value: str) -> date:
+    """:class:`date`: A date as the site writes it, e.g. ``Nov. 16, 2024`` or ``August 9, 2008``"""
+    month, day, year = value.replace(".", " ").replace(",", " ").split()
+    return date(int(year), _MONTHS[month[:3].lower()], int(day))
+
+
+class FieldSpec:
+    """How to read a single field of :class:`FighterStats` off an athlete page"""
+
+    __slots__ = ("name", "selector", "index", "source", "post", "type", "bio")
+
+    def __init__(
+        self,
+        name: str,
+        selector: Optional[str] = None,
+        index: int = 0,
+        source: str = "text",
+        post: Callable[[str], str] = _strip,
+        type: Callable = str,
+        bio: Optional[str] = None,
+    ):
+        """
+        ``selector`` is a ``tag.class`` or ``tag#id`` selector and ``index`` picks among its matches.
+        ``source`` is where the raw value comes from: ``text``, ``dd`` (the text of the first ``dd``
+        inside the element) or ``attr:<name>``. Bio fields give the ``bio`` label instead of a selector.
+        The raw value goes through ``post`` and then ``type``, unless ``post`` already returned a ``type``.
+        A failure at any step leaves the field ``None``.
+        """
+        self.name = name
+        self.selector = selector
+        self.index = index
+        self.source = source
+        self.post = post
+        self.type = type
+        self.bio = bio
+
+    def __repr__(self) -> str:
+        return f"<FieldSpec name={self.name!r} selector={self.selector or self.bio!r} index={self.index}>"
+
+
+BIO_SELECTOR = "div.c-bio__info-details"
+
+FIELDS = (
+    FieldSpec("name", "h1.hero-profile__name"),
+    FieldSpec("nickname", "p.hero-profile__nickname", post=_nickname),
+    FieldSpec("division", "p.hero-profile__division-title"),
+    FieldSpec("record", "p.hero-profile__division-body", post=_first_word),
+    FieldSpec("image_url", "img.hero-profile__image", source="attr:src", post=str),
+    FieldSpec("age", bio="Age", type=int),
+    FieldSpec("weight", bio="Weight", type=float),
+    FieldSpec("hometown", bio="Hometown"),
+    FieldSpec("activity", bio="Status"),
+    FieldSpec("height_in_inch", bio="Height", type=float),
+    FieldSpec("height_feet", bio="Height", post=_feet, type=int),
+    FieldSpec("height_inches", bio="Height", post=_inches, type=int),
+    FieldSpec("reach", bio="Reach", type=float),
+    FieldSpec("leg_reach", bio="Leg reach", type=float),
+    FieldSpec("octagon_debut", bio="Octagon Debut"),
+    FieldSpec("octagon_debut_date", bio="Octagon Debut", post=parse_date, type=date),
+    FieldSpec("trains_at", bio="Trains at"),
+    FieldSpec("striking_accuracy", "text.e-chart-circle__percent", 0, post=_percent, type=int),
+    FieldSpec("takedown_accuracy", "text.e-chart-circle__percent", 1, post=_percent, type=int),
+    FieldSpec("significant_strikes_landed", "dl.c-overlap__stats", 0, source="dd", type=int),
+    FieldSpec("significant_strikes_attempted", "dl.c-overlap__stats", 1, source="dd", type=int),
+    FieldSpec("landed_takedowns", "dl.c-overlap__stats", 2, source="dd", type=int),
+    FieldSpec("attempted_takedowns", "dl.c-overlap__stats", 3, source="dd", type=int),
+    FieldSpec("sig_str_via_standing", "div.c-stat-3bar__value", 0, post=_bar_count, type=int),
+    FieldSpec("sig_str_percentage_via_standing", "div.c-stat-3bar__value", 0, post=_bar_percent, type=int),
+    FieldSpec("sig_str_via_clinch", "div.c-stat-3bar__value", 1, post=_bar_count, type=int),
+    FieldSpec("sig_str_percentage_via_clinch", "div.c-stat-3bar__value", 1, post=_bar_percent, type=int),
+    FieldSpec("sig_str_via_ground", "div.c-stat-3bar__value", 2, post=_bar_count, type=int),
+    FieldSpec("sig_str_percentage_via_ground", "div.c-stat-3bar__value", 2, post=_bar_percent, type=int),
+    FieldSpec("wins_by_ko", "div.c-stat-3bar__value", 3, post=_bar_count, type=int),
+    FieldSpec("wins_by_ko_percentage", "div.c-stat-3bar__value", 3, post=_bar_percent, type=int),
+    FieldSpec("wins_by_dec", "div.c-stat-3bar__value", 4, post=_bar_count, type=int),
+    FieldSpec("wins_by_dec_percentage", "div.c-stat-3bar__value", 4, post=_bar_percent, type=int),
+    FieldSpec("wins_by_sub", "div.c-stat-3bar__value", 5, post=_bar_count, type=int),
+    FieldSpec("wins_by_sub_percentage", "div.c-stat-3bar__value", 5, post=_bar_percent, type=int),
+    FieldSpec("sig_str_landed_min", "div.c-stat-compare__number", 0, type=float),
+    FieldSpec("sig_str_absorbed_min", "div.c-stat-compare__number", 1, type=float),
+    FieldSpec("takedown_avg", "div.c-stat-compare__number", 2, type=float),
+    FieldSpec("submission_avg", "div.c-stat-compare__number", 3, type=float),
+    FieldSpec("sig_str_defense", "div.c-stat-compare__number", 4, type=int),
+    FieldSpec("takedown_defense", "div.c-stat-compare__number", 5, type=float),
+    FieldSpec("knockdown_avg", "div.c-stat-compare__number", 6, type=float),
+    FieldSpec("average_fight_time", "div.c-stat-compare__number", 7),
+    FieldSpec("average_fight_seconds", "div.c-stat-compare__number", 7, post=_seconds, type=int),
+    FieldSpec("sig_str_to_head", "text#e-stat-body_x5F__x5F_head_value", type=int),
+    FieldSpec("sig_str_percentage_to_head", "text#e-stat-body_x5F__x5F_head_percent", post=_percent, type=int),
+    FieldSpec("sig_str_to_body", "text#e-stat-body_x5F__x5F_body_value", type=int),
+    FieldSpec("sig_str_percentage_to_body", "text#e-stat-body_x5F__x5F_body_percent", post=_percent, type=int),
+    FieldSpec("sig_str_to_leg", "text#e-stat-body_x5F__x5F_leg_value", type=int),
+    FieldSpec("sig_str_percentage_to_leg", "text#e-stat-body_x5F__x5F_leg_percent", post=_percent, type=int),
+)
+
+
+class FighterStats:
+    """A flat record of every value read off an athlete page, one slot per :data:`FIELDS` entry"""
+
+    __slots__ = tuple(spec.name for spec in FIELDS)
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
+
+    def __repr__(self) -> str:
+        return f"<FighterStats name={self.name!r}>"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FighterStats):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def as_dict(self) -> dict:
+        """:class:`dict`: Every field of the record keyed by name"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+def _split_selector(selector: str):
+    if "#" in selector:
+        tag, id = selector.split("#", 1)
+        return tag, "id", id
+    tag, clas = selector.split(".", 1)
+    return tag, "class", clas
+
+
+def _is_soup(element) -> bool:
+    return hasattr(element, "get_text")
+
+
+def _element_text(element) -> str:
+    if _is_soup(element):
+        return element.get_text()
+    return element.text_content()
+
+
+def _first_dd(element):
+    if _is_soup(element):
+        return element.find_next("dd")
+    return element.find(".//dd")
+
+
+class Extractor:
+    def __init__(self, fields: Sequence[FieldSpec] = FIELDS):
+        """
+        A compiled extractor that evaluates every field spec in a single traversal of the page
+
+        Works on BeautifulSoup trees and on :mod:`lxml.html` trees. On lxml the selectors are
+        compiled down to the set of tag names they use, so lxml filters the walk in C and only
+        candidate elements reach Python.
+        """
+        self.fields = tuple(fields)
+        self.selectors = sorted({spec.selector for spec in self.fields if spec.selector} | {BIO_SELECTOR})
+        self._classes = {}
+        self._ids = {}
+        self._tags = set()
+        for selector in self.selectors:
+            tag, kind, value = _split_selector(selector)
+            self._tags.add(tag)
+            if kind == "id":
+                self._ids[value] = (tag, selector)
+            else:
+                self._classes.setdefault(value, []).append((tag, selector))
+        self._bio = {}
+        for spec in self.fields:
+            if spec.bio:
+                self._bio.setdefault(spec.bio, []).append(spec)
+        self._tags = tuple(sorted(self._tags))
+
+    def _bucket(self, element, tag: str, classes, id, found: Dict[str, list]) -> None:
+        for clas in classes:
+            for wanted, selector in self._classes.get(clas, ()):
+                if wanted == tag:
+                    found.setdefault(selector, []).append(element)
+        if id in self._ids and self._ids[id][0] == tag:
+            found.setdefault(self._ids[id][1], []).append(element)
+
+    def collect(self, tree) -> Dict[str, list]:
+        """:class:`Dict[str, list]`: Every element matching a selector, in document order"""
+        found = {}
+        if _is_soup(tree):
+
+            def match(tag) -> bool:
+                self._bucket(tag, tag.name, tag.get("class") or (), tag.get("id"), found)
+                return False
+
+            tree.find_all(match)
+        else:
+            for element in tree.iter(*self._tags):
+                classes = element.get("class")
+                id = element.get("id")
+                if classes or id:
+                    self._bucket(element, element.tag, classes.split() if classes else (), id, found)
+        return found
+
+    def _bio_values(self, bio) -> Dict[str, object]:
+        values = {}
+        if bio is None:
+            return values
+        if _is_soup(bio):
+            labels = ((label.string, label.find_next_sibling()) for label in bio.find_all("div", string=True))
+        else:
+            labels = (
+                (label.text, label.getnext())
+                for label in bio.iter("div")
+                if len(label) == 0 and label.text
+            )
+        for label, sibling in labels:
+            specs = self._bio.get(label)
+            if specs is None or specs[0].name in values or sibling is None:
+                continue
+            text = _element_text(sibling)
+            for spec in specs:
+                values[spec.name] = self._convert(spec, text)
+        return values
+
+    @staticmethod
+    def _convert(spec: FieldSpec, raw: str):
+        try:
+            value = spec.post(str(raw))
+            return value if isinstance(value, spec.type) else spec.type(value)
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    def _raw(self, spec: FieldSpec, element) -> Optional[str]:
+        if spec.source == "dd":
+            element = _first_dd(element)
+            if element is None:
+                return None
+            return _element_text(element)
+        if spec.source.startswith("attr:"):
+            return element.get(spec.source[len("attr:"):])
+        return _element_text(element)
+
+    def __call__(self, tree) -> FighterStats:
+        found = self.collect(tree)
+        bio = found.get(BIO_SELECTOR)
+        values = self._bio_values(bio[0] if bio else None)
+        for spec in self.fields:
+            if spec.bio:
+                continue
+            matches = found.get(spec.selector, ())
+            if spec.index >= len(matches):
+                values[spec.name] = None
+                continue
+            raw = self._raw(spec, matches[spec.index])
+            values[spec.name] = None if raw is None else self._convert(spec, raw)
+        return FighterStats(**values)
+
+
+_extractor = Extractor()
+
+
+def extract_stats(parsed_url) -> FighterStats:
+    """Builds a :class:`FighterStats` record from a parsed athlete page in a single pass"""
+    return _extractor(parsed_url)
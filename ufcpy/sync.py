@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from .listing import AthleteCard
+from .roster import hydrate, iter_pages
+from .stats import FighterStats
+from .transport import Transport, get_transport
+from .utils import athlete_url
+
+
+def content_hash(stats: FighterStats) -> str:
+    """:class:`str`: A stable hash of every field of a fighter's record"""
+    payload = json.dumps(stats.as_dict(), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChangeSet:
+    """The fighters added, updated and retired by a :class:`RosterSync` run, ``complete`` once its walk reached the last page"""
+
+    __slots__ = ("added", "updated", "retired", "failed", "unchanged", "complete")
+
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.retired = []
+        self.failed = []
+        self.unchanged = 0
+        self.complete = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<ChangeSet added={len(self.added)} updated={len(self.updated)} "
+            f"retired={len(self.retired)} failed={len(self.failed)} unchanged={self.unchanged}>"
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.retired)
+
+
+class RosterSync:
+    def __init__(self, path: str, transport: Transport = None, max_workers: int = 8):
+        """
+        Keeps a local JSON snapshot of the roster up to date, re-fetching only what changed
+
+        Every run walks the athlete directory, which is cheap, and only loads the profiles of
+        fighters who are new or whose listing record moved since the last snapshot. Pair it
+        with a :class:`Transport` backed by a :class:`DiskCache` and ``revalidate=True`` to
+        also check the other fighters with conditional GETs, only those whose page changed are loaded again
+        """
+        self.path = os.path.expanduser(path)
+        self.transport = transport
+        self.max_workers = max_workers
+        self.snapshot = self._read()
+
+    def _read(self) -> Dict[str, dict]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+
+    def _write(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as fh:
+            json.dump(self.snapshot, fh, sort_keys=True, default=str)
+        os.replace(temp, self.path)
+
+    def needs_refresh(self, card: AthleteCard) -> bool:
+        """:class:`bool`: Whether a fighter's listing card differs from the snapshot, a card without a record can't tell"""
+        entry = self.snapshot.get(card.slug)
+        if entry is None:
+            return True
+        return card.record is not None and entry.get("record") != card.record
+
+    def is_current(self, slug: str, transport: Transport = None) -> bool:
+        """:class:`bool`: Whether the server confirms a fighter's page is still the one their snapshot entry was read from"""
+        entry = self.snapshot.get(slug)
+        if entry is None or (entry.get("etag"), entry.get("last_modified")) == (None, None):
+            return False
+        cached = (transport or self.transport or get_transport()).revalidate(athlete_url(slug))
+        return cached is not None and (cached.etag, cached.last_modified) == (entry.get("etag"), entry.get("last_modified"))
+
+    def run(self, *filters: str, cards: Optional[Iterable[AthleteCard]] = None, revalidate: bool = False) -> ChangeSet:
+        """
+        :class:`ChangeSet`: Brings the snapshot up to date and returns what changed
+
+        ``cards`` replaces the directory walk, ``filters`` narrow it. With ``revalidate`` fighters whose
+        card didn't change are checked with :meth:`is_current`, those the server answers with a 304 are
+        neither downloaded nor parsed. Fighters missing from the listing are only retired on an unfiltered
+        walk that reached the last page, one cut short by an empty page leaves them be and
+        :attr:`ChangeSet.complete` ``False``
+        """
+        changes = ChangeSet()
+        last = None
+
+        def walk():
+            nonlocal last
+            for page in iter_pages(*filters, transport=self.transport):
+                last = page
+                yield from page.cards
+
+        if cards is None:
+            cards = walk()
+
+        transport = self.transport or get_transport()
+        seen = set()
+        stale = []
+        kept = []
+        for card in cards:
+            seen.add(card.slug)
+            if self.needs_refresh(card):
+                stale.append(card)
+            elif revalidate:
+                kept.append(card)
+            else:
+                changes.unchanged += 1
+
+        if kept:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                current = executor.map(lambda card: self.is_current(card.slug, transport), kept)
+                for card, is_current in zip(kept, current):
+                    if is_current:
+                        changes.unchanged += 1
+                    else:
+                        stale.append(card)
+
+        for card, result in zip(stale, hydrate(stale, max_workers=self.max_workers, transport=transport)):
+            if not result.ok:
+                changes.failed.append(result)
+                continue
+            stats = result.fighter.stats
+            digest = content_hash(stats)
+            entry = self.snapshot.get(card.slug)
+            if entry is None:
+                changes.added.append(result.fighter)
+            elif entry.get("hash") != digest:
+                changes.updated.append(result.fighter)
+            else:
+                changes.unchanged += 1
+            # The validators of the page the stats were read from, for is_current on the next run
+            cached = transport.cache.get(athlete_url(card.slug)) if transport.cache is not None else None
+            self.snapshot[card.slug] = {
+                "name": card.name,
+                "record": card.record or stats.record,
+                "hash": digest,
+                "stats": stats.as_dict(),
+                "etag": cached.etag if cached is not None else None,
+                "last_modified": cached.last_modified if cached is not None else None,
+            }
+
+        # The walk stops quietly on an empty page, only one ending on a last page with cards saw everyone
+        changes.complete = last is not None and not last.has_next
+        if changes.complete and not filters:
+            for slug in [slug for slug in self.snapshot if slug not in seen]:
+                changes.retired.append(dict(self.snapshot.pop(slug), slug=slug))
+
+        self._write()
+        return changes
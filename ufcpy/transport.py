@@ -0,0 +1,204 @@
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from .cache import CacheEntry, DiskCache
+from .scheduler import Scheduler, get_scheduler
+from .utils import check_response
+
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+class Transport:
+    def __init__(
+        self,
+        pool_size: int = 16,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        keep_alive: bool = True,
+        headers: Optional[dict] = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[DiskCache] = None,
+        scheduler: Optional[Scheduler] = None,
+    ):
+        """
+        A reusable, pooled HTTP transport shared by every request the library makes
+
+        Connections to ufc.com are kept alive and reused, failed requests are retried with
+        exponential backoff and responses are requested gzip (and brotli when installed) compressed.
+        Pass ``session`` to bring a preconfigured :class:`requests.Session` instead.
+
+        With a ``cache`` fresh pages are served from disk and stale ones are revalidated with a conditional GET.
+
+        Every request waits for its turn from ``scheduler``, the shared one from :func:`get_scheduler`
+        when not given, which also takes care of retrying 429 and 503 responses.
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.scheduler = scheduler
+        self.streams = 0
+        self.early_closes = 0
+        self.bytes_read = 0
+        self.bytes_saved = 0
+        self._stats_lock = threading.Lock()
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=Retry(
+                    total=retries,
+                    backoff_factor=backoff_factor,
+                    # 429 and 503 are left to the scheduler, which slows the host down for them
+                    status_forcelist=(500, 502, 504),
+                    allowed_methods=("GET", "HEAD"),
+                    respect_retry_after_header=False,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(make_headers(accept_encoding=True))
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+        if headers:
+            session.headers.update(headers)
+        self.session = session
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        return (self.scheduler or get_scheduler()).request(
+            url, lambda: self.session.get(url, timeout=self.timeout, **kwargs)
+        )
+
+    def get(self, url: str) -> requests.Response:
+        """:class:`requests.Response`: Sends a GET request over the pooled session, going through the cache if any"""
+        if self.cache is None:
+            return self._send(url)
+
+        entry = self.cache.get(url)
+        if entry is not None and entry.fresh:
+            return entry.to_response()
+        return self._validate(url, entry)[0]
+
+    def revalidate(self, url: str) -> Optional[CacheEntry]:
+        """
+        Optional[:class:`CacheEntry`]: The cached entry of ``url`` once it is known to be current, ``None`` otherwise
+
+        A fresh entry is current as is, a stale one when the server answers its conditional GET with a 304.
+        A page that changed is stored like :meth:`get` does. ``None`` as well without a cache or an entry
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.get(url)
+        if entry is None:
+            return None
+        if entry.fresh or self._validate(url, entry)[1]:
+            return entry
+        return None
+
+    def _validate(self, url: str, entry: Optional[CacheEntry]) -> Tuple[requests.Response, bool]:
+        # The response for a stale or missing entry and whether the server said the entry is still current
+        headers = entry.validators() if entry is not None else {}
+        res = self._send(url, headers=headers)
+        if res.status_code == 304 and entry is not None:
+            self.cache.refresh(url)
+            return entry.to_response(), True
+        if res.status_code == 200 and not any(r.status_code == 302 for r in res.history):
+            self.cache.set(
+                url,
+                res.content,
+                etag=res.headers.get("ETag"),
+                last_modified=res.headers.get("Last-Modified"),
+            )
+        return res, False
+
+    def stream(
+        self,
+        url: str,
+        consume: Callable[[bytes], bool],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        consume_whole: Optional[Callable[[bytes], Any]] = None,
+    ) -> requests.Response:
+        """
+        :class:`requests.Response`: Sends a GET request and hands the body to ``consume`` as it arrives
+
+        The redirect history goes through :func:`check_response` before any of the body is read.
+        Once ``consume`` returns ``True`` the rest of the body is skipped and the connection is closed,
+        the bytes left unread are added to :attr:`bytes_saved` when the server sent a ``Content-Length``.
+        With a ``cache`` the page goes through :meth:`get` instead, since a partial body can't be stored,
+        and is handed whole to ``consume_whole`` when given, to ``consume`` otherwise.
+        """
+        if self.cache is not None:
+            res = self.get(url)
+            check_response(res)
+            (consume_whole or consume)(res.content)
+            return res
+
+        res = self._send(url, stream=True)
+        stopped = False
+        try:
+            check_response(res)
+            for chunk in res.iter_content(chunk_size):
+                if consume(chunk):
+                    stopped = True
+                    break
+        finally:
+            # Bytes off the wire, still compressed when the page was
+            read = res.raw.tell()
+            res.close()
+            self._count_stream(read, res.headers.get("Content-Length"), stopped)
+        return res
+
+    def _count_stream(self, read: int, length: Optional[str], stopped: bool) -> None:
+        with self._stats_lock:
+            self.streams += 1
+            self.bytes_read += read
+            if stopped:
+                self.early_closes += 1
+                if length is not None and length.isdigit():
+                    self.bytes_saved += max(int(length) - read, 0)
+
+    @property
+    def stream_info(self) -> dict:
+        """:class:`dict`: How many pages were streamed, cut short, and the bytes read and saved doing so"""
+        return {
+            "streams": self.streams,
+            "early_closes": self.early_closes,
+            "bytes_read": self.bytes_read,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def close(self) -> None:
+        """Closes every pooled connection"""
+        self.session.close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """:class:`Transport`: The transport used when none is passed explicitly"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = Transport()
+    return _transport
+
+
+def set_transport(transport: Optional[Transport]) -> None:
+    """Replaces the default transport, ``None`` restores a fresh default on next use"""
+    global _transport
+    with _transport_lock:
+        _transport = transport
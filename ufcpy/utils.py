@@ -1,7 +1,36 @@
+from typing import Iterable, Tuple
 from requests import Response
 from .exceptions import UFCPyError
 
+ATHLETE_URL = "https://ufc.com/athlete"
+
+def athlete_slug(fighter: str) -> str:
+    """:class:`str`: The URL slug for a fighter's full name"""
+    return "-".join(fighter.lower().split())
+
+def athlete_url(fighter: str) -> str:
+    """:class:`str`: The athlete page URL for a fighter's full name"""
+    return f"{ATHLETE_URL}/{athlete_slug(fighter)}"
+
+def split_division(division: str) -> Tuple[str, str]:
+    """:class:`Tuple[str, str]`: The gender and weight class of a division title like ``Women's Strawweight Division``"""
+    division = (division or "").strip()
+    gender = "Woman" if division.startswith("Women's") else "Man"
+    if gender == "Woman":
+        division = division[len("Women's"):]
+    if division.endswith("Division"):
+        division = division[:-len("Division")]
+    return gender, division.strip()
+
+def check_status_codes(status_codes: Iterable[int]):
+    for status_code in status_codes:
+        if 302 == status_code:
+            raise UFCPyError("The request returned a 302 before redirecting.")
+
+def check_throttled(status_code: int):
+    if status_code in (429, 503):
+        raise UFCPyError(f"The request was throttled with a {status_code}, try again later or lower the request rate.")
+
 def check_response(response: Response):
-    for res in response.history:
-        if 302 == res.status_code:
-            raise UFCPyError("The request returned a 302 before redirecting.")
\ No newline at end of file
+    check_status_codes(res.status_code for res in response.history)
+    check_throttled(response.status_code)
\ No newline at end of file